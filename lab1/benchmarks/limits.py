@@ -0,0 +1,123 @@
+'''
+Benchmark: per-person calorie limits against the column-wise cohort API
+Name: Adarsh Rathore
+Project Title: Building a Calorie Tracking Console App
+'''
+
+import os
+import sys
+import time
+import random
+import argparse
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tracker import calculate_bmr, calculate_daily_limit, calorie_status
+from cohort import compute_limits, status_names, np
+
+ACTIVITY = [1.2, 1.375, 1.55, 1.725, 1.9]
+
+# (age, gender, weight, height, activity, intake). The first four land
+# exactly on .5 kcal, where round() and numpy's rint both go to the even
+# neighbour; the rest cover gender spellings and intake equal to the limit.
+EDGE_CASES = [
+    (30, "F", 60, 160, 1.5, 1900),     # 1289 * 1.5 = 1933.5 -> 1934
+    (25, "M", 70, 170, 1.0, 1642),     # 1642.5 -> 1642
+    (0, "F", 51, 0, 0.5, 174),         # 174.5 -> 174
+    (0, "F", 50, 0, 0.5, 170),         # 169.5 -> 170
+    (40, " male ", 82.5, 181.2, 1.725, 3000),
+    (40, "m", 82.5, 181.2, 1.725, 3000),
+    (55, "female", 64.3, 158.4, 1.2, 1800),
+    (31, "F", 60, 160, 1.5, 1926),     # exactly met
+]
+
+
+def make_people(count, seed=7):
+    rng = random.Random(seed)
+    return {
+        "age": [rng.randint(18, 80) for _ in range(count)],
+        "gender": [rng.choice("MF") for _ in range(count)],
+        "weight": [round(rng.uniform(45, 120), 1) for _ in range(count)],
+        "height": [round(rng.uniform(145, 200), 1) for _ in range(count)],
+        "activity": [rng.choice(ACTIVITY) for _ in range(count)],
+        "intake": [float(rng.randint(1200, 3200)) for _ in range(count)],
+    }
+
+
+def scalar(people):
+    limits = []
+    statuses = []
+    for age, gender, weight, height, activity, intake in zip(
+            people["age"], people["gender"], people["weight"],
+            people["height"], people["activity"], people["intake"]):
+        limit = calculate_daily_limit(calculate_bmr(weight, height, age, gender), activity)
+        limits.append(limit)
+        statuses.append(calorie_status(intake, limit))
+    return limits, statuses
+
+
+def check_equivalence():
+    # Every column path must give the scalar functions' answers exactly.
+    people = {name: [case[i] for case in EDGE_CASES] for i, name in
+              enumerate(["age", "gender", "weight", "height", "activity", "intake"])}
+    expected_bmr = [calculate_bmr(w, h, a, g) for a, g, w, h, _, _ in EDGE_CASES]
+    expected = scalar(people)
+
+    for use_numpy in ([False, True] if np is not None else [False]):
+        result = compute_limits(people["age"], people["gender"], people["weight"], people["height"],
+                                people["activity"], people["intake"], use_numpy=use_numpy)
+        got = (list(map(int, result["daily_limit"])), status_names(result["status"]))
+        if list(map(float, result["bmr"])) != expected_bmr or got != expected:
+            print(f"{'numpy' if use_numpy else 'array'} path differs from the scalar path:\n"
+                  f"  expected {expected}\n  got      {got}", file=sys.stderr)
+            sys.exit(1)
+    print(f"Equivalence check: {len(EDGE_CASES)} edge cases match the scalar path.")
+
+
+def columns(people, use_numpy):
+    result = compute_limits(people["age"], people["gender"], people["weight"], people["height"],
+                            people["activity"], people["intake"], use_numpy=use_numpy)
+    return result["daily_limit"], result["status"]
+
+
+def best_of(func, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare scalar and column-wise calorie limits")
+    parser.add_argument("--people", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    check_equivalence()
+    people = make_people(args.people)
+    base_time, (base_limits, base_status) = best_of(lambda: scalar(people), args.repeat)
+    print(f"{'path':<22} {'seconds':>9} {'people/s':>14} {'speedup':>8}")
+    print(f"{'scalar functions':<22} {base_time:>9.3f} {args.people / base_time:>14,.0f} {1:>8.1f}")
+
+    paths = [("columns (array)", people, False)]
+    if np is not None:
+        # Lists pay for conversion on every call; data already held in
+        # NumPy arrays (as a cohort table would be) does not.
+        arrays = {name: np.asarray(values) for name, values in people.items()}
+        paths.append(("numpy, list input", people, True))
+        paths.append(("numpy, array input", arrays, True))
+    else:
+        print("NumPy is not installed; only the array fallback is measured.")
+
+    for label, data, use_numpy in paths:
+        elapsed, (limits, codes) = best_of(lambda: columns(data, use_numpy), args.repeat)
+        if list(map(int, limits)) != base_limits or status_names(codes) != base_status:
+            print(f"{label}: results differ from the scalar path", file=sys.stderr)
+            sys.exit(1)
+        print(f"{label:<22} {elapsed:>9.3f} {args.people / elapsed:>14,.0f} {base_time / elapsed:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+'''
+Column-wise calorie limits for many people at once
+Name: Adarsh Rathore
+Project Title: Building a Calorie Tracking Console App
+'''
+
+import array
+from itertools import repeat
+from operator import add, gt, lt, mul, sub
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Mifflin-St Jeor: weight, height and age factors, then the offset for
+# men and for women.
+MIFFLIN_ST_JEOR = (10, 6.25, -5, 5, -161)
+STATUS_NAMES = {1: "exceeded", -1: "within", 0: "met"}
+
+
+def male_flags(gender):
+    # Same rule as calculate_bmr, decided once per distinct spelling.
+    flags = {g: str(g).strip().upper().startswith("M") for g in set(gender)}
+    return list(map(flags.__getitem__, gender))
+
+
+def _compute_numpy(age, gender, weight, height, activity, intake, formula):
+    w, h, a, male, female = formula
+    values, inverse = np.unique(np.asarray(gender, dtype=str), return_inverse=True)
+    is_male = np.array(male_flags(values), dtype=bool)[inverse.reshape(-1)]
+
+    bmr = (w * np.asarray(weight, dtype=float) + h * np.asarray(height, dtype=float)
+           + a * np.asarray(age, dtype=float) + np.where(is_male, male, female))
+    # rint rounds halves to even, as round() does in the scalar path.
+    result = {"bmr": bmr, "daily_limit": np.rint(bmr * np.asarray(activity, dtype=float)).astype(np.int64)}
+    if intake is not None:
+        result["status"] = np.sign(np.asarray(intake, dtype=float) - result["daily_limit"]).astype(np.int8)
+    return result
+
+
+def _compute_arrays(age, gender, weight, height, activity, intake, formula):
+    w, h, a, male, female = formula
+    offset = {True: male, False: female}
+    # Built from C-level maps, adding terms in the same order as the scalar
+    # formula so every result matches it exactly.
+    bmr = array.array("d", map(add, map(add, map(add, map(mul, repeat(w), weight),
+                                                      map(mul, repeat(h), height)),
+                                            map(mul, repeat(a), age)),
+                               map(offset.__getitem__, male_flags(gender))))
+    limits = array.array("q", map(round, map(mul, bmr, activity)))
+    result = {"bmr": bmr, "daily_limit": limits}
+    if intake is not None:
+        result["status"] = array.array("b", map(sub, map(gt, intake, limits), map(lt, intake, limits)))
+    return result
+
+
+def compute_limits(age, gender, weight, height, activity, intake=None,
+                   formula=MIFFLIN_ST_JEOR, use_numpy=True):
+    # Columns in, columns out: {"bmr", "daily_limit"} and, given each
+    # person's intake, "status" as 1 exceeded, -1 within, 0 met (see
+    # STATUS_NAMES). Uses NumPy arrays when it is installed, otherwise
+    # the standard array module.
+    columns = [age, gender, weight, height, activity] + ([intake] if intake is not None else [])
+    if len({len(column) for column in columns}) > 1:
+        raise ValueError("All columns must have the same length.")
+
+    if np is not None and use_numpy:
+        return _compute_numpy(age, gender, weight, height, activity, intake, formula)
+    return _compute_arrays(age, gender, weight, height, activity, intake, formula)
+
+
+def status_names(codes):
+    return [STATUS_NAMES[int(code)] for code in codes]
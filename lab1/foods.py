@@ -0,0 +1,252 @@
+'''
+Food calorie database for the Daily Calorie Tracker
+Name: Adarsh Rathore
+Project Title: Building a Calorie Tracking Console App
+'''
+
+import csv
+import sys
+import array
+import struct
+import difflib
+from collections import OrderedDict
+
+FOOD_FILE = "foods.db"
+FOOD_CACHE_SIZE = 1024
+FUZZY_CUTOFF = 0.6
+FUZZY_SCAN = 500
+LETTERS = "abcdefghijklmnopqrstuvwxyz "
+
+# File layout, little-endian: header | kcal per serving (float32 each) |
+# name offsets (uint32, one more than the count) | names, sorted, as one
+# UTF-8 block. Loading is three block reads; no per-food objects are built.
+MAGIC = b"FOODDB\x00\x01"
+HEADER = struct.Struct("<8sI")
+
+
+def normalize(name):
+    return " ".join(str(name).lower().split())
+
+
+def write_foods(path, entries):
+    # entries: (name, kcal). Returns (foods written, duplicates skipped);
+    # the first entry for a name wins.
+    foods = {}
+    skipped = 0
+    for name, kcal in entries:
+        key = normalize(name).encode("utf-8")
+        if not key:
+            continue
+        if key in foods:
+            skipped += 1
+            continue
+        foods[key] = float(kcal)
+
+    names = sorted(foods)
+    kcal = array.array("f", (foods[name] for name in names))
+    offsets = array.array("I", [0])
+    for name in names:
+        offsets.append(offsets[-1] + len(name))
+    if sys.byteorder == "big":
+        kcal.byteswap()
+        offsets.byteswap()
+
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, len(names)))
+        f.write(kcal.tobytes())
+        f.write(offsets.tobytes())
+        f.write(b"".join(names))
+    return len(names), skipped
+
+
+def read_food_csv(path, errors):
+    with open(path, "r", encoding="utf-8-sig", newline="") as f:
+        reader = csv.reader(f)
+        header = [h.strip().lower() for h in next(reader, [])]
+        if "food" not in header and "name" not in header or "calories" not in header:
+            raise ValueError(f"'{path}' needs 'food' and 'calories' columns")
+        name_col = header.index("food" if "food" in header else "name")
+        kcal_col = header.index("calories")
+        for number, row in enumerate(reader, start=2):
+            try:
+                yield row[name_col], float(row[kcal_col])
+            except (IndexError, ValueError):
+                if row:
+                    errors.append(f"food row {number}: missing or bad values")
+
+
+def edits(word):
+    # Every string one delete, swap, replace or insert away from word.
+    splits = [(word[:i], word[i:]) for i in range(len(word) + 1)]
+    yield from (a + b[1:] for a, b in splits if b)
+    yield from (a + b[1] + b[0] + b[2:] for a, b in splits if len(b) > 1)
+    yield from (a + c + b[1:] for a, b in splits if b for c in LETTERS if c != b[0])
+    yield from (a + c + b for a, b in splits for c in LETTERS)
+
+
+class FoodDatabase:
+    # Foods are looked up by binary search over the sorted name block, so a
+    # lookup reads about 20 names whatever the size. Results for repeated
+    # meal names come from a small LRU cache.
+    def __init__(self, path=FOOD_FILE, cache_size=FOOD_CACHE_SIZE):
+        self.path = path
+        self.cache_size = cache_size
+        self.cache = OrderedDict()
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+        with open(path, "rb") as f:
+            data = f.read()
+        magic, self.count = HEADER.unpack_from(data, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a food database.")
+
+        view = memoryview(data)
+        start = HEADER.size
+        self.kcal = array.array("f")
+        self.kcal.frombytes(view[start:start + self.count * 4])
+        start += self.count * 4
+        self.offsets = array.array("I")
+        self.offsets.frombytes(view[start:start + (self.count + 1) * 4])
+        if sys.byteorder == "big":
+            self.kcal.byteswap()
+            self.offsets.byteswap()
+        # Names stay in the file's own buffer; base is where they start.
+        self.data = data
+        self.base = start + (self.count + 1) * 4
+
+    def __len__(self):
+        return self.count
+
+    def _name(self, i):
+        return self.data[self.base + self.offsets[i]:self.base + self.offsets[i + 1]]
+
+    def _entry(self, i):
+        return self._name(i).decode("utf-8"), round(self.kcal[i], 2)
+
+    def _bisect(self, key):
+        lo, hi = 0, self.count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._name(mid) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def _find(self, key):
+        i = self._bisect(key)
+        if i < self.count and self._name(i) == key:
+            return i
+        return None
+
+    def get(self, name):
+        # Exact name only. Shares the cache with match(), which stores an
+        # exact hit as a one-food list.
+        query = normalize(name)
+        cached = self.cache.get(query)
+        if cached is not None:
+            self.cache.move_to_end(query)
+            self.cache_hits += 1
+            return cached[0][1] if cached and cached[0][0] == query else None
+        self.cache_misses += 1
+
+        i = self._find(query.encode("utf-8"))
+        if i is None:
+            return None
+        entry = self._entry(i)
+        if self.cache_size:
+            self.cache[query] = [entry]
+            if len(self.cache) > self.cache_size:
+                self.cache.popitem(last=False)
+        return entry[1]
+
+    def prefix(self, text, limit=10):
+        key = normalize(text).encode("utf-8")
+        results = []
+        i = self._bisect(key)
+        while i < self.count and len(results) < limit and self._name(i).startswith(key):
+            results.append(self._entry(i))
+            i += 1
+        return results
+
+    def _fuzzy(self, query, limit):
+        # Candidates are the names one edit away plus the names sharing the
+        # longest prefix the query has in common with the database, then
+        # ranked by similarity.
+        found = set()
+        for candidate in set(edits(query)):
+            i = self._find(candidate.encode("utf-8"))
+            if i is not None:
+                found.add(i)
+
+        key = query.encode("utf-8")
+        for length in range(len(key), 1, -1):
+            i = self._bisect(key[:length])
+            if i < self.count and self._name(i).startswith(key[:length]):
+                end = min(i + FUZZY_SCAN, self.count)
+                while i < end and self._name(i).startswith(key[:length]):
+                    found.add(i)
+                    i += 1
+                break
+
+        scored = []
+        matcher = difflib.SequenceMatcher(b=query, autojunk=False)
+        for i in found:
+            name, kcal = self._entry(i)
+            matcher.set_seq1(name)
+            score = matcher.ratio()
+            if score >= FUZZY_CUTOFF:
+                scored.append((score, name, kcal))
+        scored.sort(key=lambda item: (-item[0], item[1]))
+        return [(name, kcal) for _, name, kcal in scored[:limit]]
+
+    def match(self, name, limit=5):
+        # [(food, kcal)], best first: the exact food alone if there is one,
+        # otherwise the closest spellings.
+        query = normalize(name)
+        cached = self.cache.get(query)
+        if cached is not None:
+            self.cache.move_to_end(query)
+            self.cache_hits += 1
+            return cached[:limit]
+        self.cache_misses += 1
+
+        i = self._find(query.encode("utf-8"))
+        results = [self._entry(i)] if i is not None else self._fuzzy(query, max(limit, 5))
+        if self.cache_size:
+            self.cache[query] = results
+            if len(self.cache) > self.cache_size:
+                self.cache.popitem(last=False)
+        return results[:limit]
+
+    def best(self, name):
+        results = self.match(name, 1)
+        return results[0] if results else None
+
+
+def main():
+    if len(sys.argv) >= 4 and sys.argv[1] == "build":
+        errors = []
+        count, skipped = write_foods(sys.argv[3], read_food_csv(sys.argv[2], errors))
+        print(f"Wrote {count} foods to '{sys.argv[3]}' ({skipped} duplicates skipped)")
+        for error in errors[:20]:
+            print(f"  - {error}", file=sys.stderr)
+        return
+    if len(sys.argv) >= 3:
+        foods = FoodDatabase(sys.argv[1])
+        for name in sys.argv[2:]:
+            print(f"\n{name}")
+            results = foods.match(name)
+            if not results:
+                print("  no match")
+            for food, kcal in results:
+                print(f"  {food}\t{kcal}")
+        return
+    print("Usage: python foods.py build FOODS_CSV FOOD_DB\n"
+          "       python foods.py FOOD_DB MEAL [MEAL ...]", file=sys.stderr)
+    sys.exit(2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,245 @@
+'''
+Calorie history store for the Daily Calorie Tracker
+Name: Adarsh Rathore
+Project Title: Building a Calorie Tracking Console App
+'''
+
+import sys
+import sqlite3
+import datetime
+
+HISTORY_FILE = "history.db"
+WINDOWS = (7, 30)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS days (
+    user TEXT NOT NULL,
+    day TEXT NOT NULL,
+    total REAL NOT NULL,
+    meal_count INTEGER NOT NULL,
+    daily_limit REAL NOT NULL,
+    PRIMARY KEY (user, day)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS meals (
+    user TEXT NOT NULL,
+    day TEXT NOT NULL,
+    meal TEXT NOT NULL,
+    calories REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS meals_user_day ON meals (user, day);
+CREATE TABLE IF NOT EXISTS summary (
+    user TEXT PRIMARY KEY,
+    last_day TEXT NOT NULL,
+    last_total REAL NOT NULL,
+    last_limit REAL NOT NULL,
+    days_logged INTEGER NOT NULL,
+    days_over_before INTEGER NOT NULL,
+    streak_before INTEGER NOT NULL,
+    best_before INTEGER NOT NULL,
+    sum_7 REAL NOT NULL,
+    count_7 INTEGER NOT NULL,
+    sum_30 REAL NOT NULL,
+    count_30 INTEGER NOT NULL
+);
+"""
+SUMMARY_FIELDS = ["user", "last_day", "last_total", "last_limit", "days_logged", "days_over_before",
+                  "streak_before", "best_before", "sum_7", "count_7", "sum_30", "count_30"]
+
+
+def to_day(value):
+    if isinstance(value, datetime.datetime):
+        return value.date()
+    if isinstance(value, datetime.date):
+        return value
+    return datetime.date.fromisoformat(value)
+
+
+class CalorieHistory:
+    # Daily totals and meals per user, plus one summary row per user that is
+    # updated as days are recorded. The summary holds everything about the
+    # latest day separately ("before" counters cover the days up to it), so
+    # adding more meals to today never needs to look at older days, and
+    # reading a user's dashboard figures is one primary-key lookup.
+    def __init__(self, path=HISTORY_FILE):
+        self.path = path
+        self.db = sqlite3.connect(path)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        self.db.executescript(SCHEMA)
+
+    def _summary_row(self, user):
+        row = self.db.execute(f"SELECT {', '.join(SUMMARY_FIELDS)} FROM summary WHERE user = ?",
+                              (user,)).fetchone()
+        return dict(zip(SUMMARY_FIELDS, row)) if row else None
+
+    def _save_summary(self, s):
+        self.db.execute(f"INSERT OR REPLACE INTO summary ({', '.join(SUMMARY_FIELDS)}) "
+                        f"VALUES ({', '.join('?' * len(SUMMARY_FIELDS))})",
+                        [s[name] for name in SUMMARY_FIELDS])
+
+    def _window_total(self, user, start, end):
+        # Logged days from start up to but not including end.
+        return self.db.execute("SELECT COALESCE(SUM(total), 0), COUNT(*) FROM days "
+                               "WHERE user = ? AND day >= ? AND day < ?",
+                               (user, start.isoformat(), end.isoformat())).fetchone()
+
+    def record_day(self, user, day, meals, calories, daily_limit):
+        # Adds meals to a user's day. Days may arrive in any order, but only
+        # an older day than the latest one forces a rebuild of the summary.
+        with self.db:
+            self._record(user, to_day(day), meals, calories, daily_limit)
+
+    def record_many(self, entries, day):
+        # entries: (user, meals, calories, daily_limit), all for the same day,
+        # written in one transaction.
+        day = to_day(day)
+        with self.db:
+            for user, meals, calories, daily_limit in entries:
+                self._record(user, day, meals, calories, daily_limit)
+
+    def _record(self, user, day, meals, calories, daily_limit):
+        key = day.isoformat()
+        added = sum(calories)
+
+        self.db.execute("INSERT INTO days (user, day, total, meal_count, daily_limit) VALUES (?, ?, ?, ?, ?) "
+                        "ON CONFLICT (user, day) DO UPDATE SET total = total + excluded.total, "
+                        "meal_count = meal_count + excluded.meal_count, daily_limit = excluded.daily_limit",
+                        (user, key, added, len(calories), daily_limit))
+        self.db.executemany("INSERT INTO meals (user, day, meal, calories) VALUES (?, ?, ?, ?)",
+                            [(user, key, meal, cal) for meal, cal in zip(meals, calories)])
+
+        s = self._summary_row(user)
+        if s is None:
+            s = {"user": user, "last_day": key, "last_total": added, "last_limit": daily_limit,
+                 "days_logged": 1, "days_over_before": 0, "streak_before": 0, "best_before": 0,
+                 "sum_7": added, "count_7": 1, "sum_30": added, "count_30": 1}
+        elif key == s["last_day"]:
+            s["last_total"] += added
+            s["last_limit"] = daily_limit
+            s["sum_7"] += added
+            s["sum_30"] += added
+        elif key > s["last_day"]:
+            self._advance(s, day, added, daily_limit)
+        else:
+            self._rebuild(user)
+            return
+        self._save_summary(s)
+
+    def _advance(self, s, day, total, daily_limit):
+        # Close off the previous latest day, then slide both windows forward,
+        # dropping only the days that fall out of them.
+        last = to_day(s["last_day"])
+        gap = (day - last).days
+        within = s["last_total"] <= s["last_limit"]
+        streak = s["streak_before"] + 1 if within else 0
+
+        s["days_over_before"] += not within
+        s["best_before"] = max(s["best_before"], streak)
+        s["streak_before"] = streak if gap == 1 else 0
+
+        for window in WINDOWS:
+            if gap >= window:
+                window_sum, window_count = 0.0, 0
+            else:
+                dropped, dropped_count = self._window_total(
+                    s["user"], last - datetime.timedelta(days=window - 1),
+                    day - datetime.timedelta(days=window - 1))
+                window_sum = s[f"sum_{window}"] - dropped
+                window_count = s[f"count_{window}"] - dropped_count
+            s[f"sum_{window}"] = window_sum + total
+            s[f"count_{window}"] = window_count + 1
+
+        s.update(last_day=day.isoformat(), last_total=total, last_limit=daily_limit)
+        s["days_logged"] += 1
+
+    def _rebuild(self, user):
+        rows = self.db.execute("SELECT day, total, daily_limit FROM days WHERE user = ? ORDER BY day",
+                               (user,)).fetchall()
+        s = None
+        for key, total, daily_limit in rows:
+            if s is None:
+                s = {"user": user, "last_day": key, "last_total": total, "last_limit": daily_limit,
+                     "days_logged": 1, "days_over_before": 0, "streak_before": 0, "best_before": 0}
+                continue
+            last = to_day(s["last_day"])
+            within = s["last_total"] <= s["last_limit"]
+            streak = s["streak_before"] + 1 if within else 0
+            s["days_over_before"] += not within
+            s["best_before"] = max(s["best_before"], streak)
+            s["streak_before"] = streak if (to_day(key) - last).days == 1 else 0
+            s.update(last_day=key, last_total=total, last_limit=daily_limit)
+            s["days_logged"] += 1
+
+        last = to_day(s["last_day"])
+        for window in WINDOWS:
+            start = (last - datetime.timedelta(days=window - 1)).isoformat()
+            recent = [total for key, total, _ in rows if key >= start]
+            s[f"sum_{window}"] = sum(recent)
+            s[f"count_{window}"] = len(recent)
+        self._save_summary(s)
+
+    def summary(self, user):
+        # Figures as of the user's latest logged day; averages are per logged
+        # day in the 7 and 30 days ending there.
+        s = self._summary_row(user)
+        if s is None:
+            return None
+        within = s["last_total"] <= s["last_limit"]
+        streak = s["streak_before"] + 1 if within else 0
+        return {
+            "user": user,
+            "last_day": s["last_day"],
+            "last_total": s["last_total"],
+            "daily_limit": s["last_limit"],
+            "days_logged": s["days_logged"],
+            "days_over": s["days_over_before"] + (not within),
+            "current_streak": streak,
+            "best_streak": max(s["best_before"], streak),
+            "average_7": round(s["sum_7"] / s["count_7"], 2),
+            "average_30": round(s["sum_30"] / s["count_30"], 2),
+        }
+
+    def days(self, user, start=None, end=None):
+        query = "SELECT day, total, meal_count, daily_limit FROM days WHERE user = ?"
+        params = [user]
+        if start:
+            query += " AND day >= ?"
+            params.append(to_day(start).isoformat())
+        if end:
+            query += " AND day <= ?"
+            params.append(to_day(end).isoformat())
+        return self.db.execute(query + " ORDER BY day", params).fetchall()
+
+    def meals(self, user, day):
+        return self.db.execute("SELECT meal, calories FROM meals WHERE user = ? AND day = ? ORDER BY rowid",
+                               (user, to_day(day).isoformat())).fetchall()
+
+    def close(self):
+        self.db.close()
+
+
+def format_summary(s):
+    return (f"Last logged day:\t{s['last_day']} ({s['last_total']} of {s['daily_limit']} kcal)\n"
+            f"7-day average:\t\t{s['average_7']:.2f} kcal\n"
+            f"30-day average:\t\t{s['average_30']:.2f} kcal\n"
+            f"Days logged:\t\t{s['days_logged']} ({s['days_over']} over the limit)\n"
+            f"Streak within limit:\t{s['current_streak']} day(s), best {s['best_streak']}")
+
+
+def main():
+    if len(sys.argv) < 3:
+        print("Usage: python history.py HISTORY_DB USER [USER ...]", file=sys.stderr)
+        sys.exit(2)
+
+    history = CalorieHistory(sys.argv[1])
+    try:
+        for user in sys.argv[2:]:
+            s = history.summary(user)
+            print(f"\n{user}")
+            print(format_summary(s) if s else "No history recorded.")
+    finally:
+        history.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -5,119 +5,504 @@ Date: 10 October 2025
 Project Title: Building a Calorie Tracking Console App
 '''
 
-print("---------------------------------------------")
-print(" Welcome to the Daily Calorie Tracker CLI 🍽️")
-print("---------------------------------------------")
-print("\nThis tool helps you log your meals and track your daily calorie intake. In this tool you can:\n"
-" - Add meals with calorie values.\n" 
-" - View your total calories intake for the day.\n" 
-" - Compare against your personal daily limit.\n" 
-" - Save your session for future reference.")
+import io
+import os
+import csv
+import sys
+import json
+import time
+import sqlite3
+import argparse
+import datetime
+from itertools import groupby
+from operator import itemgetter
+from concurrent.futures import ThreadPoolExecutor
 
+REPORT_FOLDER = "daily_calorie_tracker"
+PROFILE_COLUMNS = [("user", "name"), ("age",), ("gender",), ("weight",), ("height",), ("activity",)]
+MEAL_COLUMNS = [("user", "name"), ("meal",), ("calories",)]
+SUMMARY_LINE = "--------------------------------\n"
+WRITE_BATCH = 1000
+CONSOLIDATED_FIELDS = ["user", "date", "daily_limit", "meal_count", "total_calories", "average_calories", "status"]
 
-user_name = input("\nEnter your name: ")                
-age = int(input("Enter your age: "))
-gender = input("Enter gender(M/F): ")
-weight = float(input("Enter weight(kg): "))
-height = float(input("Enter height(cm): "))
-activity = float(input("Enter activity factor(1.2=sedentary, 1.375=light, 1.55=moderate, 1.725=very, 1.9=extra): "))
+CONSOLE_STATUS = {
+    "exceeded": "Warning: You have exceeded your daily calorie limit!",
+    "within": "Good job! You are within your daily calorie limit.",
+    "met": "You have exactly met your daily calorie limit.",
+}
+REPORT_STATUS = {
+    "exceeded": "Status: Exceeded daily calorie limit!\n",
+    "within": "Status: Within daily calorie limit.\n",
+    "met": "Status: Exactly met daily calorie limit.\n",
+}
 
-if gender == "M":
-    bmr = 10*weight + 6.25*height - 5*age + 5
-else:
-    bmr = 10*weight + 6.25*height - 5*age - 161
 
-daily_limit = round(bmr*activity)
-print(f"\nDaily Calorie limit is: {daily_limit} kcal")
+def calculate_bmr(weight, height, age, gender):
+    # Mifflin-St Jeor equation.
+    if gender.strip().upper().startswith("M"):
+        return 10*weight + 6.25*height - 5*age + 5
+    return 10*weight + 6.25*height - 5*age - 161
 
-meals = []
-calories = []
-num_meals = int(input("How many meals do you want to log today?: "))
-for i in range(num_meals):
-    meal_name = input(f"\nEnter the name of meal {i+1}: ")
-    calorie_amount = float(input(f"Enter the calorie amount for {meal_name}: "))
-    meals.append(meal_name) 
-    calories.append(calorie_amount)
-print("\nMeals logged:", meals)
-print("Calories logged:", calories)
 
-if len(calories) == 0:
-    print("No meals logged. Total calories consumed today: 0 Kcal")
-else:
-    total_calories = sum(calories)
+def calculate_daily_limit(bmr, activity):
+    return round(bmr*activity)
 
-average_calories = total_calories / len(calories)
 
-print(f"\nTotal calories consumed today: {total_calories} kcal")
-print(f"Average calories per meal: {average_calories:.2f} kcal")
+def calculate_total(calories):
+    return sum(calories)
 
 
+def calculate_average(calories):
+    if not calories:
+        return 0
+    return sum(calories) / len(calories)
 
-if total_calories > daily_limit:
-    print("Warning: You have exceeded your daily calorie limit!")
-elif total_calories < daily_limit:
-    print("Good job! You are within your daily calorie limit.")
-else:
-    print("You have exactly met your daily calorie limit.")
 
+def calorie_status(total_calories, daily_limit):
+    if total_calories > daily_limit:
+        return "exceeded"
+    if total_calories < daily_limit:
+        return "within"
+    return "met"
 
-print("\n=======================================")
-print("           Daily Calorie Summary       ")
-print("=======================================")
-print("Meal Name\t\tCalories (kcal)")
-print("---------------------------------------")
 
+def format_report(user_name, now, meals, calories, daily_limit):
+    total_calories = calculate_total(calories)
+    average_calories = calculate_average(calories)
 
-for meal, cal in zip(meals, calories):
-    print(f"{meal}\t\t\t{cal}")
+    lines = [
+        "Daily Calorie Tracker Report\n",
+        f"User: {user_name}\n",
+        f"Date & Time: {now}\n\n",
+        "Meal Name\tCalories (kcal)\n",
+        SUMMARY_LINE,
+    ]
+    lines.extend(f"{meal}\t{cal}\n" for meal, cal in zip(meals, calories))
+    lines.append(SUMMARY_LINE)
+    lines.append(f"Total Calories:\t{total_calories}\n")
+    lines.append(f"Average Calories:\t{average_calories:.2f}\n")
+    lines.append(REPORT_STATUS[calorie_status(total_calories, daily_limit)])
+    return "".join(lines)
 
 
-print("---------------------------------------")
-print(f"Total Calories:\t\t{total_calories}")
-print(f"Average Calories\t{average_calories:.2f}")
-print("=======================================")
+def report_path(folder, user_name, suffix="sample_output"):
+    safe_name = "".join(c if c.isalnum() or c in " -_." else "_" for c in user_name).strip() or "user"
+    return os.path.join(folder, f"{safe_name}_{suffix}.txt")
 
 
-import datetime
-import os
+def save_report(filepath, text):
+    with open(filepath, "w") as file:
+        file.write(text)
 
-folder_name = "daily_calorie_tracker"
-if not os.path.exists(folder_name):
-    os.makedirs(folder_name)
 
+def save_reports(items):
+    for filepath, text in items:
+        save_report(filepath, text)
 
-save_choice = input("Do you want to save this session report to a file? (yes/no): ").lower()
 
-if save_choice == "yes":
-    now = datetime.datetime.now()
-    timestamp = now.strftime("%Y%m%d_%H%M%S")
-    filename = f"{user_name}_sample_output.txt" 
+class ReportWriter:
+    # Reports are rendered into memory and written a batch at a time: one
+    # file per user through a thread pool, or every user as one line of a
+    # single file for the day. A batch is written while the next renders.
+    def __init__(self, folder, consolidated=None, workers=8, now=None):
+        self.folder = folder
+        self.consolidated = consolidated
+        self.now = now or datetime.datetime.now()
+        self.count = 0
+        self.render_seconds = 0.0
+        self.write_seconds = 0.0
+        self.pending = []
+        self.in_flight = []
+        os.makedirs(folder, exist_ok=True)
 
-   
-    filepath = os.path.join(folder_name, filename)
+        if consolidated:
+            self.path = os.path.join(folder, f"reports_{self.now:%Y-%m-%d}.{consolidated}")
+            self.handle = open(self.path, "w", newline="", encoding="utf-8")
+            self.buffer = io.StringIO()
+            self.rows = csv.writer(self.buffer)
+            if consolidated == "csv":
+                self.rows.writerow(CONSOLIDATED_FIELDS)
+            self.pool = None
+        else:
+            self.path = folder
+            self.workers = workers
+            self.pool = ThreadPoolExecutor(max_workers=workers)
 
-   
-    with open(filepath, "w") as file:
-        file.write("Daily Calorie Tracker Report\n")
-        file.write(f"User: {user_name}\n")
-        file.write(f"Date & Time: {now}\n\n")
-        file.write("Meal Name\tCalories (kcal)\n")
-        file.write("--------------------------------\n")
-        for meal, cal in zip(meals, calories):
-            file.write(f"{meal}\t{cal}\n")
-        file.write("--------------------------------\n")
-        file.write(f"Total Calories:\t{total_calories}\n")
-        file.write(f"Average Calories:\t{average_calories:.2f}\n")
-
-        
-        if total_calories > daily_limit:
-            file.write("Status: Exceeded daily calorie limit!\n")
-        elif total_calories < daily_limit:
-            file.write("Status: Within daily calorie limit.\n")
+    def add(self, user, meals, calories, daily_limit):
+        start = time.perf_counter()
+        if self.consolidated:
+            total_calories = calculate_total(calories)
+            values = [user, f"{self.now:%Y-%m-%d}", daily_limit, len(calories), total_calories,
+                      round(calculate_average(calories), 2), calorie_status(total_calories, daily_limit)]
+            if self.consolidated == "csv":
+                self.rows.writerow(values)
+            else:
+                record = dict(zip(CONSOLIDATED_FIELDS, values))
+                record["meals"] = [{"meal": m, "calories": c} for m, c in zip(meals, calories)]
+                self.buffer.write(json.dumps(record) + "\n")
+        else:
+            self.pending.append((report_path(self.folder, user, "report"),
+                                 format_report(user, self.now, meals, calories, daily_limit)))
+        self.render_seconds += time.perf_counter() - start
+
+        self.count += 1
+        if self.count % WRITE_BATCH == 0:
+            self.flush()
+
+    def _wait(self):
+        start = time.perf_counter()
+        for future in self.in_flight:
+            future.result()
+        self.in_flight = []
+        self.write_seconds += time.perf_counter() - start
+
+    def flush(self):
+        if self.consolidated:
+            start = time.perf_counter()
+            self.handle.write(self.buffer.getvalue())
+            self.buffer.seek(0)
+            self.buffer.truncate()
+            self.write_seconds += time.perf_counter() - start
+            return
+
+        if not self.pending:
+            return
+        # Keep at most one batch in flight so memory stays bounded.
+        self._wait()
+        share = -(-len(self.pending) // self.workers)
+        self.in_flight = [self.pool.submit(save_reports, self.pending[i:i + share])
+                          for i in range(0, len(self.pending), share)]
+        self.pending = []
+
+    def close(self):
+        self.flush()
+        if self.consolidated:
+            self.handle.close()
         else:
-            file.write("Status: Exactly met daily calorie limit.\n")
+            self._wait()
+            self.pool.shutdown()
+
+
+def open_foods(path=None):
+    from foods import FoodDatabase, FOOD_FILE
+    path = path or FOOD_FILE
+    if not os.path.exists(path):
+        return None
+    try:
+        return FoodDatabase(path)
+    except (OSError, ValueError) as e:
+        print(f"Could not load food database '{path}': {e}")
+        return None
+
+
+def ask_calories(meal_name, foods):
+    # With a food database the closest food is offered as the default, so
+    # Enter accepts it; typing a number still overrides it.
+    matches = foods.match(meal_name, 3) if foods else []
+    if not matches:
+        return float(input(f"Enter the calorie amount for {meal_name}: "))
+
+    print("Found: " + ", ".join(f"{food} ({kcal} kcal)" for food, kcal in matches))
+    answer = input(f"Enter the calorie amount for {meal_name} [{matches[0][1]}]: ").strip()
+    return float(answer) if answer else matches[0][1]
+
+
+def run_interactive():
+    print("---------------------------------------------")
+    print(" Welcome to the Daily Calorie Tracker CLI 🍽️")
+    print("---------------------------------------------")
+    print("\nThis tool helps you log your meals and track your daily calorie intake. In this tool you can:\n"
+    " - Add meals with calorie values.\n"
+    " - View your total calories intake for the day.\n"
+    " - Compare against your personal daily limit.\n"
+    " - Save your session for future reference.")
+
+    user_name = input("\nEnter your name: ")
+    age = int(input("Enter your age: "))
+    gender = input("Enter gender(M/F): ")
+    weight = float(input("Enter weight(kg): "))
+    height = float(input("Enter height(cm): "))
+    activity = float(input("Enter activity factor(1.2=sedentary, 1.375=light, 1.55=moderate, 1.725=very, 1.9=extra): "))
+
+    bmr = calculate_bmr(weight, height, age, gender)
+    daily_limit = calculate_daily_limit(bmr, activity)
+    print(f"\nDaily Calorie limit is: {daily_limit} kcal")
+
+    foods = open_foods()
+    meals = []
+    calories = []
+    num_meals = int(input("How many meals do you want to log today?: "))
+    for i in range(num_meals):
+        meal_name = input(f"\nEnter the name of meal {i+1}: ")
+        calorie_amount = ask_calories(meal_name, foods)
+        meals.append(meal_name)
+        calories.append(calorie_amount)
+    print("\nMeals logged:", meals)
+    print("Calories logged:", calories)
+
+    if len(calories) == 0:
+        print("No meals logged. Total calories consumed today: 0 Kcal")
+
+    total_calories = calculate_total(calories)
+    average_calories = calculate_average(calories)
+
+    print(f"\nTotal calories consumed today: {total_calories} kcal")
+    print(f"Average calories per meal: {average_calories:.2f} kcal")
+
+    print(CONSOLE_STATUS[calorie_status(total_calories, daily_limit)])
+
+    print("\n=======================================")
+    print("           Daily Calorie Summary       ")
+    print("=======================================")
+    print("Meal Name\t\tCalories (kcal)")
+    print("---------------------------------------")
+
+    for meal, cal in zip(meals, calories):
+        print(f"{meal}\t\t\t{cal}")
+
+    print("---------------------------------------")
+    print(f"Total Calories:\t\t{total_calories}")
+    print(f"Average Calories\t{average_calories:.2f}")
+    print("=======================================")
+
+    record_history(user_name, meals, calories, daily_limit)
+
+    save_choice = input("Do you want to save this session report to a file? (yes/no): ").lower()
+
+    if save_choice == "yes":
+        now = datetime.datetime.now()
+        os.makedirs(REPORT_FOLDER, exist_ok=True)
+        filepath = report_path(REPORT_FOLDER, user_name)
+        save_report(filepath, format_report(user_name, now, meals, calories, daily_limit))
+        print(f"Session report saved successfully as '{filepath}'")
+    else:
+        print("Session report was not saved.")
+
+
+def record_history(user_name, meals, calories, daily_limit):
+    # Every session is kept, saved report or not, so totals build up per day.
+    # history.py is imported here, not at the top, so other scripts can
+    # import this module's calculation functions from any folder.
+    from history import CalorieHistory, HISTORY_FILE, format_summary
+    try:
+        os.makedirs(REPORT_FOLDER, exist_ok=True)
+        history = CalorieHistory(os.path.join(REPORT_FOLDER, HISTORY_FILE))
+        try:
+            history.record_day(user_name.strip(), datetime.date.today(), meals, calories, daily_limit)
+            summary = history.summary(user_name.strip())
+        finally:
+            history.close()
+    except (OSError, sqlite3.Error) as e:
+        print(f"Could not update calorie history: {e}")
+        return
+
+    print("\n---------------- History ----------------")
+    print(format_summary(summary))
+    print("-----------------------------------------\n")
+
+
+def find_column(header, names, path):
+    for name in names:
+        if name in header:
+            return header.index(name)
+    raise ValueError(f"'{path}' has no '{names[0]}' column")
+
+
+def pick(record, names):
+    for name in names:
+        if name in record:
+            return record[name]
+    raise KeyError(names[0])
+
+
+def read_table(path, columns):
+    # CSV with a header row, or JSON Lines. Yields (row number, values) with
+    # only the wanted columns; a row missing one of them gives None.
+    with open(path, "r", encoding="utf-8-sig", newline="") as f:
+        if path.lower().endswith(".csv"):
+            reader = csv.reader(f)
+            header = [h.strip().lower() for h in next(reader, [])]
+            getter = itemgetter(*[find_column(header, names, path) for names in columns])
+            for number, row in enumerate(reader, start=2):
+                if not row:
+                    continue
+                try:
+                    yield number, getter(row)
+                except IndexError:
+                    yield number, None
+            return
+
+        for number, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+            try:
+                record = {k.lower(): v for k, v in json.loads(line).items()}
+                yield number, tuple(pick(record, names) for names in columns)
+            except (ValueError, AttributeError, KeyError):
+                yield number, None
+
+
+def load_profiles(path, errors):
+    # user -> daily limit; profiles are small next to the meal log.
+    limits = {}
+    for number, values in read_table(path, PROFILE_COLUMNS):
+        try:
+            user, age, gender, weight, height, activity = values
+            bmr = calculate_bmr(float(weight), float(height), int(age), str(gender))
+            limits[str(user).strip()] = calculate_daily_limit(bmr, float(activity))
+        except (TypeError, ValueError) as e:
+            errors.append(f"profile row {number}: {'missing or bad values' if values is None else e}")
+    return limits
+
+
+def iter_meals(path, errors, foods=None):
+    # Blank calories are filled in from the food database when there is one.
+    # Only an exact food name counts: nobody checks a batch fill-in, so a
+    # near miss would book some other food's calories unnoticed.
+    for number, values in read_table(path, MEAL_COLUMNS):
+        try:
+            user, meal, cal = values
+            if foods and (cal is None or not str(cal).strip()):
+                cal = foods.get(meal)
+                if cal is None:
+                    errors.append(f"meal row {number}: no calories and no food named '{meal}'")
+                    continue
+            yield str(user).strip(), str(meal), float(cal)
+        except (TypeError, ValueError) as e:
+            errors.append(f"meal row {number}: {'missing or bad values' if values is None else e}")
+
+
+def iter_user_meals(path, errors, grouped=True, foods=None):
+    # With the log grouped by user each user's meals are held only until the
+    # next user starts; an ungrouped log has to be collected first.
+    meals = iter_meals(path, errors, foods)
+    if not grouped:
+        collected = {}
+        for user, meal, cal in meals:
+            entry = collected.setdefault(user, ([], []))
+            entry[0].append(meal)
+            entry[1].append(cal)
+        yield from ((user, names, cals) for user, (names, cals) in collected.items())
+        return
+
+    for user, entries in groupby(meals, key=lambda entry: entry[0]):
+        names = []
+        cals = []
+        for _, meal, cal in entries:
+            names.append(meal)
+            cals.append(cal)
+        yield user, names, cals
+
+
+def run_batch(profiles_path, meals_path, folder=REPORT_FOLDER, grouped=True,
+              consolidated=None, workers=8, history_path=None, day=None, foods_path=None):
+    start = time.perf_counter()
+    errors = []
+    try:
+        limits = load_profiles(profiles_path, errors)
+    except (OSError, ValueError) as e:
+        print(f"Cannot read profiles: {e}", file=sys.stderr)
+        return 1
+    try:
+        foods = None
+        if foods_path:
+            from foods import FoodDatabase
+            foods = FoodDatabase(foods_path)
+    except (OSError, ValueError) as e:
+        print(f"Cannot read food database: {e}", file=sys.stderr)
+        return 1
+    now = datetime.datetime.combine(day, datetime.datetime.now().time()) if day else None
+    writer = ReportWriter(folder, consolidated, workers, now)
+    history = None
+    if history_path:
+        from history import CalorieHistory
+        history = CalorieHistory(history_path)
+    recorded = []
+    recorded_count = 0
+    written = set()
+    counts = {"exceeded": 0, "within": 0, "met": 0}
+    meal_count = 0
+
+    try:
+        user_meals = iter_user_meals(meals_path, errors, grouped, foods)
+        for user, meals, calories in user_meals:
+            if user not in limits:
+                errors.append(f"no profile for user '{user}' ({len(meals)} meals skipped)")
+                continue
+            if user in written:
+                errors.append(f"meals for '{user}' are not grouped together; rerun with --ungrouped")
+                continue
+
+            writer.add(user, meals, calories, limits[user])
+            written.add(user)
+            if history:
+                recorded.append((user, meals, calories, limits[user]))
+                if len(recorded) == WRITE_BATCH:
+                    history.record_many(recorded, writer.now)
+                    recorded_count += len(recorded)
+                    recorded = []
+            meal_count += len(meals)
+            counts[calorie_status(calculate_total(calories), limits[user])] += 1
+
+        # Users with no meals logged get a report but no history entry.
+        for user in limits.keys() - written:
+            writer.add(user, [], [], limits[user])
+            counts[calorie_status(0, limits[user])] += 1
+
+        if history:
+            history.record_many(recorded, writer.now)
+            recorded_count += len(recorded)
+    except (OSError, ValueError) as e:
+        print(f"Cannot read meals: {e}", file=sys.stderr)
+        return 1
+    except sqlite3.Error as e:
+        print(f"Cannot update history: {e}", file=sys.stderr)
+        return 1
+    finally:
+        writer.close()
+        if history:
+            history.close()
+
+    elapsed = time.perf_counter() - start
+    print(f"Wrote {writer.count} reports ({meal_count} meals) to '{writer.path}' in {elapsed:.2f}s")
+    print(f"  rendering: {writer.render_seconds:.2f}s, waiting on writes: {writer.write_seconds:.2f}s")
+    if foods:
+        print(f"Food lookups: {foods.cache_hits + foods.cache_misses} ({foods.cache_hits} cached)")
+    if history:
+        print(f"Recorded {recorded_count} users' day in '{history_path}'")
+    print(f"Exceeded: {counts['exceeded']}  Within: {counts['within']}  Met: {counts['met']}")
+    if errors:
+        print(f"{len(errors)} problem(s):", file=sys.stderr)
+        for error in errors[:20]:
+            print(f"  - {error}", file=sys.stderr)
+        if len(errors) > 20:
+            print(f"  ... and {len(errors) - 20} more", file=sys.stderr)
+    return 1 if errors else 0
+
+
+def main():
+    if len(sys.argv) == 1:
+        run_interactive()
+        return
+
+    parser = argparse.ArgumentParser(description="Daily Calorie Tracker batch mode")
+    parser.add_argument("profiles", help="CSV/JSON Lines with user, age, gender, weight, height, activity")
+    parser.add_argument("meals", help="CSV/JSON Lines with user, meal, calories")
+    parser.add_argument("-o", "--output", default=REPORT_FOLDER, help="folder for the reports")
+    parser.add_argument("--ungrouped", action="store_true",
+                        help="the meal log is not grouped by user (holds it all in memory)")
+    parser.add_argument("--consolidated", choices=["jsonl", "csv"],
+                        help="write one reports_<date> file for everyone instead of one file per user")
+    parser.add_argument("-w", "--workers", type=int, default=8, help="threads writing report files")
+    parser.add_argument("--history", metavar="DB", help="also add the day's meals to this calorie history database")
+    parser.add_argument("--date", type=datetime.date.fromisoformat,
+                        help="day the meal log is for (YYYY-MM-DD, default today)")
+    parser.add_argument("--foods", metavar="DB", help="food database used for meals with blank calories")
+    args = parser.parse_args()
+
+    sys.exit(run_batch(args.profiles, args.meals, args.output, not args.ungrouped,
+                       args.consolidated, args.workers, args.history, args.date, args.foods))
 
-    print(f"Session report saved successfully as '{filepath}'")
-else:
-    print("Session report was not saved.")
 
+if __name__ == "__main__":
+    main()
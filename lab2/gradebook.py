@@ -1,7 +1,257 @@
+import os
 import csv
-import statistics
+import sys
+import glob
+import json
+import argparse
+from math import ceil
+from array import array
+from functools import partial
+from concurrent.futures import ProcessPoolExecutor
+from bisect import bisect_left, bisect_right
 from pathlib import Path
 
+NAME_KEYS = ['name', 'student', 'id']
+MARK_KEYS = ['mark', 'score', 'grade', 'points']
+CHUNK_SIZE = 50000
+HISTOGRAM_STEPS = 100
+
+
+class GradeScale:
+    # Bands are (lowest mark, grade), best grade first. Grading a mark is one
+    # bisect into the cutoffs, however many grades the scale has.
+    def __init__(self, name, bands, pass_mark=None):
+        self.name = name
+        self.bands = list(bands)
+        worst_first = self.bands[::-1]
+        self.cutoffs = [mark for mark, _ in worst_first[1:]]
+        self.letters = [grade for _, grade in worst_first]
+        # By default passing means getting above the lowest grade.
+        self.pass_mark = self.cutoffs[0] if pass_mark is None else pass_mark
+
+    def grade(self, mark):
+        return self.letters[bisect_right(self.cutoffs, mark)]
+
+    def grade_all(self, marks):
+        cutoffs, letters = self.cutoffs, self.letters
+        return [letters[bisect_right(cutoffs, mark)] for mark in marks]
+
+    def order(self):
+        return [grade for _, grade in self.bands]
+
+    def count(self, ordered):
+        # Band sizes straight from marks that are already sorted.
+        bounds = [0] + [bisect_left(ordered, cutoff) for cutoff in self.cutoffs] + [len(ordered)]
+        counts = {}
+        for i in range(len(self.letters) - 1, -1, -1):
+            counts[self.letters[i]] = bounds[i + 1] - bounds[i]
+        return counts
+
+    def curved(self, add=0, multiply=1):
+        # Raising every mark is the same as lowering every cutoff, so a curve
+        # costs nothing per student.
+        bands = [((mark - add) / multiply, grade) for mark, grade in self.bands[:-1]]
+        bands.append(self.bands[-1])
+        return GradeScale(f"{self.name}, curved", bands, (self.pass_mark - add) / multiply)
+
+
+STANDARD_SCALE = GradeScale('standard', [(90, 'A'), (80, 'B'), (70, 'C'), (60, 'D'), (0, 'F')])
+PLUS_MINUS_SCALE = GradeScale('plus-minus', [
+    (97, 'A+'), (93, 'A'), (90, 'A-'), (87, 'B+'), (83, 'B'), (80, 'B-'),
+    (77, 'C+'), (73, 'C'), (70, 'C-'), (67, 'D+'), (63, 'D'), (60, 'D-'), (0, 'F'),
+])
+SCALES = {scale.name: scale for scale in (STANDARD_SCALE, PLUS_MINUS_SCALE)}
+PASS_MARK = STANDARD_SCALE.pass_mark
+RELATIVE_SHARES = [('A', 0.10), ('B', 0.20), ('C', 0.40), ('D', 0.20), ('F', 0.10)]
+
+
+def relative_scale(ordered, shares=RELATIVE_SHARES, pass_mark=None):
+    # Grades by rank in the class: cutoffs are read off one sorted list of
+    # marks, then every student is graded by the usual bisect. Ties at a
+    # cutoff all get the better grade. Passing follows rank too, so by
+    # default it starts at the lowest grade above F.
+    count = len(ordered)
+    bands = []
+    taken = 0.0
+    for grade, share in shares[:-1]:
+        taken += share
+        index = count - ceil(round(count * taken, 9))
+        bands.append((ordered[index] if 0 <= index < count else float('inf'), grade))
+    bands.append((0, shares[-1][0]))
+    return GradeScale('relative', bands, pass_mark)
+
+
+class GradeColumns:
+    # Names in a list and marks in a flat array of doubles, so the stats run
+    # on C-level builtins (sum, max, one sort) instead of walking a dict.
+    def __init__(self, names=(), marks=()):
+        self.names = list(names)
+        self.marks = array('d', marks)
+
+    @classmethod
+    def from_dict(cls, marks_dict):
+        return cls(marks_dict.keys(), marks_dict.values())
+
+    def __len__(self):
+        return len(self.marks)
+
+    def append(self, name, mark):
+        self.names.append(name)
+        self.marks.append(mark)
+
+    def average(self):
+        if not self.marks:
+            return 0
+        return sum(self.marks) / len(self.marks)
+
+    def median(self, ordered=None):
+        if not self.marks:
+            return 0
+        ordered = ordered or sorted(self.marks)
+        middle = len(ordered) // 2
+        if len(ordered) % 2:
+            return ordered[middle]
+        return (ordered[middle - 1] + ordered[middle]) / 2
+
+    def top(self):
+        if not self.marks:
+            return 0.0, None
+        score = max(self.marks)
+        return score, self.names[self.marks.index(score)]
+
+    def bottom(self):
+        if not self.marks:
+            return 0.0, None
+        score = min(self.marks)
+        return score, self.names[self.marks.index(score)]
+
+    def grades(self, scale=STANDARD_SCALE):
+        return scale.grade_all(self.marks)
+
+    def distribution(self, ordered=None, scale=STANDARD_SCALE):
+        return scale.count(ordered or sorted(self.marks))
+
+    def pass_fail(self, passing_threshold=PASS_MARK):
+        passed, failed = [], []
+        for name, mark in zip(self.names, self.marks):
+            (passed if mark >= passing_threshold else failed).append(name)
+        return passed, failed
+
+    def summarize(self, scale=STANDARD_SCALE, passing_threshold=None, ordered=None):
+        # One sort gives the median, min, max, every grade band and the pass
+        # count; the bands and threshold are binary searches into it.
+        ordered = ordered or sorted(self.marks)
+        if passing_threshold is None:
+            passing_threshold = scale.pass_mark
+        count = len(ordered)
+        max_score, max_student = self.top()
+        min_score, min_student = self.bottom()
+        return {
+            'count': count,
+            'average': self.average(),
+            'median': self.median(ordered),
+            'max': (max_score, max_student),
+            'min': (min_score, min_student),
+            'distribution': self.distribution(ordered, scale),
+            'passed': count - bisect_left(ordered, passing_threshold),
+            'threshold': passing_threshold,
+        }
+
+
+class StreamingStats:
+    # Running totals over chunks of rows, so a file of any size is analyzed
+    # in fixed memory. Marks are 0-100, so the median comes from a histogram
+    # with one bin per 0.01 mark: exact for marks given to two decimals.
+    def __init__(self, scale=STANDARD_SCALE, passing_threshold=None, preview=5):
+        self.scale = scale
+        self.passing_threshold = scale.pass_mark if passing_threshold is None else passing_threshold
+        self.preview = preview
+        self.count = 0
+        self.total = 0.0
+        self.max = (0.0, None)
+        self.min = (0.0, None)
+        self.passed = 0
+        self.passed_names = []
+        self.failed_names = []
+        self.grade_counts = {grade: 0 for grade in scale.order()}
+        self.histogram = array('q', [0]) * (100 * HISTOGRAM_STEPS + 1)
+
+    def add(self, columns):
+        if not len(columns):
+            return
+
+        ordered = sorted(columns.marks)
+        top, bottom = columns.top(), columns.bottom()
+        if self.max[1] is None or top[0] > self.max[0]:
+            self.max = top
+        if self.min[1] is None or bottom[0] < self.min[0]:
+            self.min = bottom
+
+        self.count += len(ordered)
+        self.total += sum(columns.marks)
+        self.passed += len(ordered) - bisect_left(ordered, self.passing_threshold)
+        for grade, count in columns.distribution(ordered, self.scale).items():
+            self.grade_counts[grade] += count
+
+        histogram = self.histogram
+        for mark in ordered:
+            histogram[int(mark * HISTOGRAM_STEPS + 1e-6)] += 1
+
+        for name, mark in zip(columns.names, columns.marks):
+            if len(self.passed_names) >= self.preview and len(self.failed_names) >= self.preview:
+                break
+            names = self.passed_names if mark >= self.passing_threshold else self.failed_names
+            if len(names) < self.preview:
+                names.append(name)
+
+    def merge(self, other):
+        # Every field is a count, a sum or an extreme, so per-file results
+        # combine exactly, the median included.
+        if other.max[1] is not None and (self.max[1] is None or other.max[0] > self.max[0]):
+            self.max = other.max
+        if other.min[1] is not None and (self.min[1] is None or other.min[0] < self.min[0]):
+            self.min = other.min
+
+        self.count += other.count
+        self.total += other.total
+        self.passed += other.passed
+        for grade, count in other.grade_counts.items():
+            self.grade_counts[grade] += count
+        for i, count in enumerate(other.histogram):
+            if count:
+                self.histogram[i] += count
+
+        self.passed_names.extend(other.passed_names[:self.preview - len(self.passed_names)])
+        self.failed_names.extend(other.failed_names[:self.preview - len(self.failed_names)])
+
+    def _nth(self, n):
+        seen = 0
+        for i, count in enumerate(self.histogram):
+            seen += count
+            if seen > n:
+                return i / HISTOGRAM_STEPS
+        return 0
+
+    def median(self):
+        if not self.count:
+            return 0
+        middle = self.count // 2
+        if self.count % 2:
+            return self._nth(middle)
+        return (self._nth(middle - 1) + self._nth(middle)) / 2
+
+    def summarize(self):
+        return {
+            'count': self.count,
+            'average': self.total / self.count if self.count else 0,
+            'median': self.median(),
+            'max': self.max,
+            'min': self.min,
+            'distribution': dict(self.grade_counts),
+            'passed': self.passed,
+            'threshold': self.passing_threshold,
+        }
+
 
 def print_welcome():
     print("\n" + "="*60)
@@ -21,11 +271,12 @@ def get_input_method():
         print("How would you like to input student data?")
         print("1. Manual entry (type names and marks)")
         print("2. Load from CSV file")
-        choice = input("\nEnter your choice (1 or 2): ").strip()
+        print("3. Stream a large CSV file (summary only, low memory)")
+        choice = input("\nEnter your choice (1, 2 or 3): ").strip()
 
-        if choice in ['1', '2']:
+        if choice in ['1', '2', '3']:
             return choice
-        print("❌ Invalid choice. Please enter 1 or 2.\n")
+        print("❌ Invalid choice. Please enter 1, 2 or 3.\n")
 
 
 def manual_data_entry():
@@ -73,10 +324,80 @@ def manual_data_entry():
     return marks
 
 
+def detect_columns(header_row):
+    fieldnames = [h.strip().lower() for h in header_row]
+
+    name_col_index = -1
+    mark_col_index = -1
+
+    for i, h in enumerate(fieldnames):
+        if any(k in h for k in NAME_KEYS) and name_col_index == -1:
+            name_col_index = i
+        if any(k in h for k in MARK_KEYS) and mark_col_index == -1:
+            mark_col_index = i
+
+    return name_col_index, mark_col_index
+
+
+def parse_row(row, name_col_index, mark_col_index):
+    if len(row) <= max(name_col_index, mark_col_index):
+        raise ValueError('missing columns')
+
+    name = row[name_col_index].strip()
+    if not name:
+        raise ValueError('empty name')
+
+    try:
+        mark = float(row[mark_col_index].strip())
+    except ValueError:
+        raise ValueError('marks not a number')
+    if not (0 <= mark <= 100):
+        raise ValueError('marks outside 0-100')
+    return name, mark
+
+
+def read_csv_chunks(filepath, rejected, chunk_size=CHUNK_SIZE):
+    with open(filepath, 'r', encoding='utf-8-sig', newline='') as f:
+        reader = csv.reader(f)
+
+        header_row = next(reader, None)
+        if header_row is None:
+            raise ValueError("CSV file is empty.")
+
+        name_col_index, mark_col_index = detect_columns(header_row)
+        if name_col_index == -1 or mark_col_index == -1:
+            raise ValueError(f"Could not detect 'Name' and 'Marks' columns in: {', '.join(header_row)}")
+
+        chunk = GradeColumns()
+        for row in reader:
+            if not any(row):
+                continue
+            try:
+                name, mark = parse_row(row, name_col_index, mark_col_index)
+            except ValueError as e:
+                rejected[str(e)] = rejected.get(str(e), 0) + 1
+                continue
+
+            chunk.append(name, mark)
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = GradeColumns()
+
+        if len(chunk):
+            yield chunk
+
+
+def print_rejected(rejected):
+    total = sum(rejected.values())
+    if not total:
+        return
+    print(f"⚠️ Skipped {total} invalid row(s):")
+    for reason, count in sorted(rejected.items(), key=lambda item: -item[1]):
+        print(f"  • {reason}: {count}")
+
+
 def load_csv_data():
     print("\n--- CSV FILE IMPORT ---\n")
-    NAME_KEYS = ['name', 'student', 'id']
-    MARK_KEYS = ['mark', 'score', 'grade', 'points']
 
     while True:
         filepath = input("Enter CSV file path (e.g., students.csv): ").strip()
@@ -97,16 +418,7 @@ def load_csv_data():
                     print("❌ CSV file is empty. Please check your file.\n")
                     continue
 
-                fieldnames = [h.strip().lower() for h in header_row]
-
-                name_col_index = -1
-                mark_col_index = -1
-                
-                for i, h in enumerate(fieldnames):
-                    if any(k in h for k in NAME_KEYS) and name_col_index == -1:
-                        name_col_index = i
-                    if any(k in h for k in MARK_KEYS) and mark_col_index == -1:
-                        mark_col_index = i
+                name_col_index, mark_col_index = detect_columns(header_row)
 
                 if name_col_index == -1 or mark_col_index == -1:
                     print("❌ Could not automatically detect 'Name' and 'Marks' columns.")
@@ -114,18 +426,18 @@ def load_csv_data():
                     print("Please ensure your file has columns containing 'name'/'student' and 'mark'/'score'/'grade'.\n")
                     continue
 
+                rejected = {}
                 for row in reader:
                     if not any(row):
                         continue
-                        
+
                     try:
-                        name = row[name_col_index].strip()
-                        mark = float(row[mark_col_index].strip())
-                        
-                        if name and 0 <= mark <= 100:
-                            marks[name] = mark
-                    except (IndexError, ValueError):
-                        continue
+                        name, mark = parse_row(row, name_col_index, mark_col_index)
+                        marks[name] = mark
+                    except ValueError as e:
+                        rejected[str(e)] = rejected.get(str(e), 0) + 1
+
+            print_rejected(rejected)
 
             if not marks:
                 print("❌ No valid student records found in this CSV.\nMake sure the file has 'Name' and 'Marks' columns and valid data (0-100).\n")
@@ -139,87 +451,75 @@ def load_csv_data():
 
 
 def calculate_average(marks_dict):
-    if not marks_dict:
-        return 0
-    return sum(marks_dict.values()) / len(marks_dict)
+    return GradeColumns.from_dict(marks_dict).average()
 
 
 def calculate_median(marks_dict):
-    if not marks_dict:
-        return 0
-    return statistics.median(marks_dict.values())
+    return GradeColumns.from_dict(marks_dict).median()
 
 
 def find_max_score(marks_dict):
-    if not marks_dict:
-        return 0.0, None
-    max_student = max(marks_dict, key=marks_dict.get)
-    return marks_dict[max_student], max_student
+    return GradeColumns.from_dict(marks_dict).top()
 
 
 def find_min_score(marks_dict):
-    if not marks_dict:
-        return 0.0, None
-    min_student = min(marks_dict, key=marks_dict.get)
-    return marks_dict[min_student], min_student
-
-
-def assign_grade(mark):
-    if mark >= 90:
-        return 'A'
-    elif mark >= 80:
-        return 'B'
-    elif mark >= 70:
-        return 'C'
-    elif mark >= 60:
-        return 'D'
-    else:
-        return 'F'
+    return GradeColumns.from_dict(marks_dict).bottom()
 
 
-def create_grades_dict(marks_dict):
-    return {name: assign_grade(mark) for name, mark in marks_dict.items()}
+def assign_grade(mark, scale=STANDARD_SCALE):
+    return scale.grade(mark)
 
 
-def get_grade_distribution(grades_dict):
-    distribution = {'A': 0, 'B': 0, 'C': 0, 'D': 0, 'F': 0}
+def create_grades_dict(marks_dict, scale=STANDARD_SCALE):
+    columns = GradeColumns.from_dict(marks_dict)
+    return dict(zip(columns.names, columns.grades(scale)))
+
+
+def get_grade_distribution(grades_dict, scale=STANDARD_SCALE):
+    distribution = {grade: 0 for grade in scale.order()}
     for grade in grades_dict.values():
         if grade in distribution:
             distribution[grade] += 1
     return distribution
 
 
-def get_pass_fail_students(marks_dict, passing_threshold=40):
-    passed = [name for name, mark in marks_dict.items() if mark >= passing_threshold]
-    failed = [name for name, mark in marks_dict.items() if mark < passing_threshold]
+def get_pass_fail_students(marks_dict, passing_threshold=PASS_MARK):
+    passed, failed = GradeColumns.from_dict(marks_dict).pass_fail(passing_threshold)
     return passed, failed, passing_threshold
 
 
-def display_statistics(marks_dict):
+def display_statistics(marks_dict, summary=None):
     if not marks_dict:
         return 
-        
-    avg = calculate_average(marks_dict)
-    median = calculate_median(marks_dict)
-    max_score, max_student = find_max_score(marks_dict)
-    min_score, min_student = find_min_score(marks_dict)
+
+    print_statistics(summary or GradeColumns.from_dict(marks_dict).summarize())
+
+
+def print_statistics(summary):
+    avg = summary['average']
+    median = summary['median']
+    max_score, max_student = summary['max']
+    min_score, min_student = summary['min']
 
     print("\n" + "="*60)
     print("STATISTICAL ANALYSIS")
     print("="*60)
-    print(f"Total Students: {len(marks_dict)}")
+    print(f"Total Students: {summary['count']}")
     print(f"Average Score: {avg:^28.2f}")
     print(f"Median Score: {median:^29.2f}")
     print(f"Highest Score: {max_score:^28.2f} (Student: {max_student})")
     print(f"Lowest Score: {min_score:^29.2f} (Student: {min_student})")
 
 
-def display_grade_distribution(grades_dict):
+def display_grade_distribution(grades_dict, distribution=None):
     if not grades_dict:
         return
 
-    distribution = get_grade_distribution(grades_dict)
-    total_students = len(grades_dict)
+    print_grade_distribution(distribution or get_grade_distribution(grades_dict))
+
+
+def print_grade_distribution(distribution):
+    total_students = sum(distribution.values())
 
     print("\n" + "="*60)
     print("GRADE DISTRIBUTION")
@@ -227,33 +527,37 @@ def display_grade_distribution(grades_dict):
     print(f"{'Grade':<10} {'Count':<10} {'Percentage':>10}")
     print("-" * 30)
 
-    for grade in ['A', 'B', 'C', 'D', 'F']:
-        count = distribution.get(grade, 0)
+    for grade, count in distribution.items():
         percentage = (count / total_students * 100) if total_students > 0 else 0
         print(f"{grade:<10} {count:<10} {percentage:>10.1f}%")
 
 
-def display_pass_fail_summary(marks_dict):
+def display_pass_fail_summary(marks_dict, columns=None, threshold=PASS_MARK):
     if not marks_dict:
         return
 
-    passed, failed, threshold = get_pass_fail_students(marks_dict)
+    if columns is None:
+        passed, failed, threshold = get_pass_fail_students(marks_dict, threshold)
+    else:
+        passed, failed = columns.pass_fail(threshold)
+
+    print_pass_fail(len(passed), len(failed), passed[:5], failed[:5], threshold)
 
+
+def print_pass_fail(passed_count, failed_count, passed_names, failed_names, threshold):
     print("\n" + "="*60)
     print("PASS/FAIL SUMMARY")
     print("="*60)
     
-    print(f"Passed (≥{threshold}): {len(passed)} students")
-    if passed:
-        preview_names = passed[:5]
-        suffix = '...' if len(passed) > 5 else ''
-        print(f"  → {', '.join(preview_names)}{suffix}")
+    print(f"Passed (≥{threshold}): {passed_count} students")
+    if passed_names:
+        suffix = '...' if passed_count > len(passed_names) else ''
+        print(f"  → {', '.join(passed_names)}{suffix}")
 
-    print(f"Failed (<{threshold}): {len(failed)} students")
-    if failed:
-        preview_names = failed[:5]
-        suffix = '...' if len(failed) > 5 else ''
-        print(f"  → {', '.join(preview_names)}{suffix}")
+    print(f"Failed (<{threshold}): {failed_count} students")
+    if failed_names:
+        suffix = '...' if failed_count > len(failed_names) else ''
+        print(f"  → {', '.join(failed_names)}{suffix}")
 
 
 def display_results_table(marks_dict, grades_dict):
@@ -331,16 +635,50 @@ def get_next_action(exported):
             print("❌ Invalid choice. Please enter 1 or 2.\n")
 
 
+def read_number(prompt):
+    while True:
+        try:
+            return float(input(prompt).strip())
+        except ValueError:
+            print("❌ Please enter a valid number.\n")
+
+
+def choose_grading_scale(ordered=None):
+    print("\n" + "-"*60)
+    print("Which grading scale should be used?")
+    print("1. Standard (A/B/C/D/F)")
+    print("2. Plus/minus (A+ to D-, F)")
+    print("3. Standard with a curve (add points to every mark)")
+    if ordered is not None:
+        print("4. Relative (top 10% A, next 20% B, 40% C, 20% D, bottom 10% F)")
+
+    while True:
+        choice = input("\nEnter your choice (Enter for 1): ").strip() or '1'
+        if choice == '1':
+            return STANDARD_SCALE
+        if choice == '2':
+            return PLUS_MINUS_SCALE
+        if choice == '3':
+            return STANDARD_SCALE.curved(add=read_number("Points to add: "))
+        if choice == '4' and ordered is not None:
+            return relative_scale(ordered)
+        print("❌ Invalid choice.\n")
+
+
 def analyze_gradebook(marks_dict):
     if not marks_dict:
         print("❌ No student data available for analysis.")
         return 'analyze_new' 
 
-    grades_dict = create_grades_dict(marks_dict)
-    
-    display_statistics(marks_dict)
-    display_grade_distribution(grades_dict)
-    display_pass_fail_summary(marks_dict)
+    columns = GradeColumns.from_dict(marks_dict)
+    ordered = sorted(columns.marks)
+    scale = choose_grading_scale(ordered)
+    summary = columns.summarize(scale, ordered=ordered)
+    grades_dict = dict(zip(columns.names, columns.grades(scale)))
+
+    display_statistics(marks_dict, summary)
+    display_grade_distribution(grades_dict, summary['distribution'])
+    display_pass_fail_summary(marks_dict, columns, summary['threshold'])
     display_results_table(marks_dict, grades_dict)
     
     exported = False
@@ -352,6 +690,155 @@ def analyze_gradebook(marks_dict):
     return get_next_action(exported) 
 
 
+def analyze_csv_stream():
+    print("\n--- STREAMING CSV ANALYSIS ---\n")
+
+    while True:
+        filepath = input("Enter CSV file path (e.g., exam_board.csv): ").strip()
+
+        file = Path(filepath)
+        if not file.exists():
+            print(f"❌ File '{filepath}' not found. Try again or check the path.\n")
+            continue
+
+        stats = StreamingStats(choose_grading_scale())
+        rejected = {}
+        try:
+            for chunk in read_csv_chunks(file, rejected):
+                stats.add(chunk)
+        except ValueError as e:
+            print(f"❌ {e}\n")
+            continue
+        except Exception as e:
+            print(f"❌ Error reading file: {type(e).__name__}: {e}\n")
+            continue
+
+        print_rejected(rejected)
+        if not stats.count:
+            print("❌ No valid student records found in this CSV.\n")
+            continue
+
+        print(f"✓ Streamed {stats.count} valid rows from '{filepath}'.")
+        summary = stats.summarize()
+        print_statistics(summary)
+        print_grade_distribution(summary['distribution'])
+        print_pass_fail(summary['passed'], summary['count'] - summary['passed'],
+                        stats.passed_names, stats.failed_names, summary['threshold'])
+        return get_next_action(False)
+
+
+def analyze_file(filepath, scale=STANDARD_SCALE):
+    # Runs in a worker process; errors come back as data instead of raising.
+    stats = StreamingStats(scale)
+    rejected = {}
+    try:
+        for chunk in read_csv_chunks(filepath, rejected):
+            stats.add(chunk)
+    except Exception as e:
+        return filepath, None, rejected, f"{type(e).__name__}: {e}"
+    return filepath, stats, rejected, None
+
+
+def find_csv_files(target):
+    if os.path.isdir(target):
+        return sorted(str(p) for p in Path(target).glob('*.csv'))
+    return sorted(glob.glob(target, recursive=True))
+
+
+def summary_row(label, summary, rejected):
+    return {
+        'file': label,
+        'students': summary['count'],
+        'average': round(summary['average'], 2),
+        'median': summary['median'],
+        'highest': summary['max'][0],
+        'highest_student': summary['max'][1],
+        'lowest': summary['min'][0],
+        'lowest_student': summary['min'][1],
+        **summary['distribution'],
+        'passed': summary['passed'],
+        'failed': summary['count'] - summary['passed'],
+        'rejected': sum(rejected.values()),
+    }
+
+
+def write_batch_report(output, rows, errors):
+    if output.lower().endswith('.json'):
+        with open(output, 'w', encoding='utf-8') as f:
+            json.dump({'files': rows[:-1], 'overall': rows[-1], 'errors': errors}, f, indent=2)
+        return
+
+    with open(output, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=list(rows[-1].keys()))
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def run_batch(target, output=None, workers=None, scale=STANDARD_SCALE):
+    files = find_csv_files(target)
+    if not files:
+        print(f"❌ No CSV files match '{target}'.")
+        return 1
+
+    overall = StreamingStats(scale)
+    overall_rejected = {}
+    rows = []
+    errors = {}
+
+    # One file per task; results come back in file order.
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for filepath, stats, rejected, error in pool.map(partial(analyze_file, scale=scale), files):
+            if error:
+                errors[filepath] = error
+                print(f"❌ {filepath}: {error}")
+                continue
+            if not stats.count:
+                errors[filepath] = "no valid student records"
+                print(f"❌ {filepath}: no valid student records")
+                continue
+
+            overall.merge(stats)
+            for reason, count in rejected.items():
+                overall_rejected[reason] = overall_rejected.get(reason, 0) + count
+            rows.append(summary_row(filepath, stats.summarize(), rejected))
+
+    if not overall.count:
+        print("❌ None of the files had valid student records.")
+        return 1
+
+    rows.append(summary_row('ALL', overall.summarize(), overall_rejected))
+
+    print(f"{'File':<30} {'Students':>9} {'Average':>8} {'Median':>7} {'Passed':>7} {'Rejected':>9}")
+    print("-" * 74)
+    for row in rows:
+        print(f"{Path(row['file']).name:<30} {row['students']:>9} {row['average']:>8.2f} "
+              f"{row['median']:>7.2f} {row['passed']:>7} {row['rejected']:>9}")
+
+    if output:
+        write_batch_report(output, rows, errors)
+        print(f"\n✓ Report written to '{output}'")
+    return 1 if errors else 0
+
+
+def main():
+    if len(sys.argv) == 1:
+        main_menu_loop()
+        return
+
+    parser = argparse.ArgumentParser(description="GradeBook Analyzer batch mode")
+    parser.add_argument('target', help="directory of CSV files or a glob such as 'sections/*.csv'")
+    parser.add_argument('-o', '--output', help="write per-file and overall results to a .csv or .json file")
+    parser.add_argument('-w', '--workers', type=int, help="worker processes (default: one per core)")
+    parser.add_argument('-s', '--scale', choices=sorted(SCALES), default='standard', help="grading scale")
+    parser.add_argument('-c', '--curve', type=float, default=0, help="points added to every mark before grading")
+    args = parser.parse_args()
+
+    scale = SCALES[args.scale]
+    if args.curve:
+        scale = scale.curved(add=args.curve)
+    sys.exit(run_batch(args.target, args.output, args.workers, scale))
+
+
 def main_menu_loop():
     print_welcome()
     
@@ -360,15 +847,17 @@ def main_menu_loop():
     while True:
         method = get_input_method()
         
-        if method == '1':
-            marks = manual_data_entry()
-        elif method == '2':
-            marks = load_csv_data()
-        
-        if not marks:
-            continue
+        if method == '3':
+            action = analyze_csv_stream()
+        else:
+            if method == '1':
+                marks = manual_data_entry()
+            elif method == '2':
+                marks = load_csv_data()
 
-        action = analyze_gradebook(marks)
+            if not marks:
+                continue
+            action = analyze_gradebook(marks)
 
         if action == 'exit':
             print("\n" + "="*60)
@@ -379,4 +868,4 @@ def main_menu_loop():
             continue
 
 if __name__ == "__main__":
-    main_menu_loop()
+    main()
@@ -0,0 +1,62 @@
+# --------------------------------------------------------------------
+# Name        : Adarsh Rathore
+# Roll No     : <2501410014>
+# Course      : B.Tech CSE (Cyber Security)
+# Semester    : 1st Semester
+# Subject     : Programming for Problem Solving Using Python
+# File        : book_memory.py
+# Project     : Library Inventory Manager
+# --------------------------------------------------------------------
+
+
+import sys
+import os
+import gc
+import tracemalloc
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from library_manager.book import Book
+
+
+class DictBook:
+    # The Book layout before slots: a per-instance __dict__ and a status
+    # string on every object.
+    def __init__(self, title, author, isbn, status="available"):
+        self.title = title
+        self.author = author
+        self.isbn = isbn
+        self.status = status
+
+
+def make_rows(count):
+    # Statuses come from parsing, so each one is its own string object.
+    return [(f"Title {i}", f"Author {i % 1000}", str(100000 + i),
+             "".join(["avail", "able"]) if i % 3 else "".join(["iss", "ued"]))
+            for i in range(count)]
+
+
+def bytes_per_book(cls, rows):
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    books = [cls(*row) for row in rows]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return (after - before) / len(books)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    rows = make_rows(count)
+
+    old = bytes_per_book(DictBook, rows)
+    new = bytes_per_book(Book, rows)
+
+    print(f"Books measured       : {count}")
+    print(f"Before (__dict__)    : {old:.1f} bytes/book")
+    print(f"After (__slots__)    : {new:.1f} bytes/book")
+    print(f"Saved                : {old - new:.1f} bytes/book ({(1 - new / old) * 100:.1f}%)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+# --------------------------------------------------------------------
+# Name        : Adarsh Rathore
+# Roll No     : <2501410014>
+# Course      : B.Tech CSE (Cyber Security)
+# Semester    : 1st Semester
+# Subject     : Programming for Problem Solving Using Python
+# File        : catalogue.py
+# Project     : Library Inventory Manager
+# --------------------------------------------------------------------
+
+
+import json
+import random
+import argparse
+
+SUBJECTS = ["Python", "Java", "Data", "Networks", "Security", "Cloud", "Linux", "Algorithms",
+            "Databases", "Compilers", "Graphics", "Statistics", "Calculus", "Physics",
+            "Chemistry", "Biology", "History", "Economics", "Design", "Music"]
+QUALIFIERS = ["Basics", "Fundamentals", "Advanced", "Essentials", "Guide", "Handbook",
+              "Introduction", "Mastery", "Patterns", "Principles", "Practice", "Theory",
+              "Cookbook", "Primer", "Workshop", "Reference"]
+FIRST_NAMES = ["John", "Priya", "Ankit", "Sarah", "Robert", "Mohit", "Kevin", "Thomas",
+               "Dennis", "Andrew", "James", "Michael", "Alex", "Brian", "Ramez", "Mark"]
+LAST_NAMES = ["Smith", "Sharma", "Jones", "King", "Yadav", "Fox", "Cormen", "Ritchie",
+              "Tanenbaum", "Lee", "Brown", "Nero", "Elmasri", "Allen", "Martin", "Malhotra"]
+
+# Extra made-up words so title vocabulary grows with the catalogue.
+SYLLABLES = ["ka", "lo", "mi", "ra", "ten", "vo", "shi", "du", "pe", "zan", "ri", "om"]
+
+
+def make_word(rng):
+    return "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4))).capitalize()
+
+
+def generate(count, seed=42):
+    rng = random.Random(seed)
+    for i in range(count):
+        words = [rng.choice(SUBJECTS), rng.choice(QUALIFIERS)]
+        words.extend(make_word(rng) for _ in range(rng.randint(0, 3)))
+        rng.shuffle(words)
+        yield {
+            "title": " ".join(words),
+            "author": f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}",
+            "isbn": str(9780000000000 + i),
+            "status": "issued" if rng.random() < 0.1 else "available",
+        }
+
+
+def write_catalogue(path, count, seed=42):
+    with open(path, "w") as f:
+        for record in generate(count, seed):
+            f.write(json.dumps(record) + "\n")
+    return path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Write a synthetic data.jsonl catalogue")
+    parser.add_argument("count", type=int)
+    parser.add_argument("--output", default="data.jsonl")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    write_catalogue(args.output, args.count, args.seed)
+    print(f"Wrote {args.count} books to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+# --------------------------------------------------------------------
+# Name        : Adarsh Rathore
+# Roll No     : <2501410014>
+# Course      : B.Tech CSE (Cyber Security)
+# Semester    : 1st Semester
+# Subject     : Programming for Problem Solving Using Python
+# File        : concurrency_stress.py
+# Project     : Library Inventory Manager
+# --------------------------------------------------------------------
+
+
+import sys
+import os
+import time
+import random
+import argparse
+import tempfile
+import threading
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from library_manager.inventory import LibraryInventory
+from library_manager.book import Book
+
+
+def desk(inv, isbns, rounds, holders, check_lock, stats, seed):
+    rng = random.Random(seed)
+    held = []
+
+    for _ in range(rounds):
+        if held and rng.random() < 0.5:
+            isbn = held.pop(rng.randrange(len(held)))
+            with check_lock:
+                holders[isbn] -= 1
+            inv.return_book(isbn)
+            stats["returns"] += 1
+            continue
+
+        isbn = rng.choice(isbns)
+        try:
+            inv.issue_book(isbn)
+        except ValueError:
+            stats["refused"] += 1
+            continue
+
+        with check_lock:
+            holders[isbn] += 1
+            if holders[isbn] > 1:
+                stats["double_issues"] += 1
+        held.append(isbn)
+        stats["issues"] += 1
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Issue/return stress test for LibraryInventory")
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--books", type=int, default=200)
+    parser.add_argument("--rounds", type=int, default=5000)
+    parser.add_argument("--no-journal", action="store_true",
+                        help="rewrite the data file on every change instead of journaling")
+    args = parser.parse_args()
+
+    folder = tempfile.mkdtemp(prefix="library-stress-")
+    file = os.path.join(folder, "data.jsonl")
+    journal = not args.no_journal
+
+    inv = LibraryInventory(file=file, journal=journal, legacy_file=None)
+    isbns = [str(100000 + i) for i in range(args.books)]
+    inv.add_books(Book(f"Book {i}", f"Author {i}", isbn) for i, isbn in enumerate(isbns))
+
+    holders = {isbn: 0 for isbn in isbns}
+    check_lock = threading.Lock()
+    all_stats = []
+    threads = []
+
+    start = time.perf_counter()
+    for n in range(args.threads):
+        stats = {"issues": 0, "returns": 0, "refused": 0, "double_issues": 0}
+        all_stats.append(stats)
+        t = threading.Thread(target=desk, args=(inv, isbns, args.rounds, holders, check_lock, stats, n))
+        threads.append(t)
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - start
+    inv.close()
+
+    totals = {key: sum(s[key] for s in all_stats) for key in all_stats[0]}
+    operations = totals["issues"] + totals["returns"] + totals["refused"]
+
+    # Every issued copy must be held by exactly one desk, and a fresh load
+    # from disk must agree with the in-memory state.
+    expected = {isbn: "issued" if holders[isbn] else "available" for isbn in isbns}
+    memory_ok = all(inv.search_isbn(isbn).status == expected[isbn] for isbn in isbns)
+    reloaded = LibraryInventory(file=file, journal=journal, legacy_file=None)
+    disk_ok = all(reloaded.search_isbn(isbn).status == expected[isbn] for isbn in isbns)
+    reloaded.close()
+
+    print(f"Threads           : {args.threads}")
+    print(f"Operations        : {operations} in {elapsed:.2f}s ({operations / elapsed:.0f} ops/s)")
+    print(f"Issues / returns  : {totals['issues']} / {totals['returns']} ({totals['refused']} refused)")
+    print(f"Double issues     : {totals['double_issues']}")
+    print(f"Memory consistent : {memory_ok}")
+    print(f"Disk consistent   : {disk_ok}")
+
+    if totals["double_issues"] or not memory_ok or not disk_ok:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
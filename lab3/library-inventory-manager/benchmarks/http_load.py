@@ -0,0 +1,108 @@
+# --------------------------------------------------------------------
+# Name        : Adarsh Rathore
+# Roll No     : <2501410014>
+# Course      : B.Tech CSE (Cyber Security)
+# Semester    : 1st Semester
+# Subject     : Programming for Problem Solving Using Python
+# File        : http_load.py
+# Project     : Library Inventory Manager
+# --------------------------------------------------------------------
+
+
+import json
+import time
+import random
+import asyncio
+import argparse
+
+
+async def request(reader, writer, method, path, body=None):
+    data = json.dumps(body).encode() if body is not None else b""
+    writer.write((f"{method} {path} HTTP/1.1\r\nHost: localhost\r\n"
+                  f"Content-Length: {len(data)}\r\n\r\n").encode() + data)
+    await writer.drain()
+
+    head = await reader.readuntil(b"\r\n\r\n")
+    status = int(head.split(b" ", 2)[1])
+    length = 0
+    for line in head.split(b"\r\n"):
+        if line.lower().startswith(b"content-length:"):
+            length = int(line.split(b":", 1)[1])
+    await reader.readexactly(length)
+    return status
+
+
+async def client(host, port, isbns, queries, deadline, latencies, statuses, seed):
+    rng = random.Random(seed)
+    reader, writer = await asyncio.open_connection(host, port)
+
+    try:
+        while time.perf_counter() < deadline:
+            roll = rng.random()
+            if roll < 0.4:
+                method, path = "GET", f"/books/{rng.choice(isbns)}"
+            elif roll < 0.7:
+                method, path = "GET", f"/search?q={rng.choice(queries)}"
+            elif roll < 0.85:
+                method, path = "POST", f"/books/{rng.choice(isbns)}/issue"
+            else:
+                method, path = "POST", f"/books/{rng.choice(isbns)}/return"
+
+            start = time.perf_counter()
+            status = await request(reader, writer, method, path)
+            latencies.append(time.perf_counter() - start)
+            statuses[status] = statuses.get(status, 0) + 1
+    finally:
+        writer.close()
+
+
+def percentile(values, pct):
+    values = sorted(values)
+    if not values:
+        return 0.0
+    return values[min(len(values) - 1, int(len(values) * pct / 100))]
+
+
+async def run(args):
+    reader, writer = await asyncio.open_connection(args.host, args.port)
+    await request(reader, writer, "GET", "/books?limit=1")
+    writer.close()
+
+    isbns = [str(100000 + i) for i in range(args.books)]
+    queries = ["book", "auth", "python", "data", "intro"]
+
+    # Make sure the books exist; 409 just means an earlier run added them.
+    reader, writer = await asyncio.open_connection(args.host, args.port)
+    for i, isbn in enumerate(isbns):
+        await request(reader, writer, "POST", "/books",
+                      {"title": f"Load Book {i}", "author": f"Author {i % 50}", "isbn": isbn})
+    writer.close()
+
+    latencies = []
+    statuses = {}
+    deadline = time.perf_counter() + args.duration
+    start = time.perf_counter()
+    await asyncio.gather(*(client(args.host, args.port, isbns, queries, deadline, latencies, statuses, n)
+                           for n in range(args.clients)))
+    elapsed = time.perf_counter() - start
+
+    print(f"Clients       : {args.clients}")
+    print(f"Requests      : {len(latencies)} in {elapsed:.2f}s")
+    print(f"Throughput    : {len(latencies) / elapsed:.0f} req/s")
+    print(f"Latency p50   : {percentile(latencies, 50) * 1000:.2f} ms")
+    print(f"Latency p99   : {percentile(latencies, 99) * 1000:.2f} ms")
+    print(f"Status codes  : {dict(sorted(statuses.items()))}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load generator for cli/server.py")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--clients", type=int, default=50)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--books", type=int, default=500)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,200 @@
+# --------------------------------------------------------------------
+# Name        : Adarsh Rathore
+# Roll No     : <2501410014>
+# Course      : B.Tech CSE (Cyber Security)
+# Semester    : 1st Semester
+# Subject     : Programming for Problem Solving Using Python
+# File        : run_benchmarks.py
+# Project     : Library Inventory Manager
+# --------------------------------------------------------------------
+
+
+import sys
+import os
+import json
+import time
+import random
+import shutil
+import argparse
+import platform
+import resource
+import tempfile
+import subprocess
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from library_manager.inventory import LibraryInventory
+from library_manager.book import Book
+from catalogue import write_catalogue, SUBJECTS, QUALIFIERS
+
+HIGHER_IS_WORSE = ("p50_ms", "p95_ms", "p99_ms", "seconds", "peak_rss_mb")
+
+
+def summarize(samples, total=None):
+    samples = sorted(samples)
+    n = len(samples)
+    total = sum(samples) if total is None else total
+
+    def pct(p):
+        return samples[min(n - 1, int(n * p / 100))] * 1000
+
+    return {
+        "ops": n,
+        "ops_per_sec": round(n / total, 1) if total else 0.0,
+        "p50_ms": round(pct(50), 4),
+        "p95_ms": round(pct(95), 4),
+        "p99_ms": round(pct(99), 4),
+    }
+
+
+def measure(func, args_list):
+    samples = []
+    start = time.perf_counter()
+    for args in args_list:
+        t = time.perf_counter()
+        func(*args)
+        samples.append(time.perf_counter() - t)
+    return summarize(samples, time.perf_counter() - start)
+
+
+def peak_rss_mb():
+    # ru_maxrss is KiB on Linux and bytes on macOS.
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return round(peak / (1024 * 1024 if platform.system() == "Darwin" else 1024), 1)
+
+
+def bench_size(size, ops, workdir):
+    rng = random.Random(size)
+    file = os.path.join(workdir, "data.jsonl")
+    write_catalogue(file, size)
+    results = {"size": size}
+
+    start = time.perf_counter()
+    inv = LibraryInventory(file=file, journal=True, journal_limit=10 ** 9, legacy_file=None)
+    results["load"] = {"seconds": round(time.perf_counter() - start, 4)}
+
+    isbns = [str(9780000000000 + rng.randrange(size)) for _ in range(ops)]
+    results["isbn_lookup"] = measure(inv.search_isbn, [(i,) for i in isbns])
+
+    words = SUBJECTS + QUALIFIERS
+    queries = [rng.choice(words).lower()[:rng.randint(3, 8)] for _ in range(max(1, ops // 10))]
+    results["title_search"] = measure(inv.search_title, [(q,) for q in queries])
+    results["ranked_search"] = measure(inv.search, [(q,) for q in queries])
+
+    new_books = [Book(f"Bench Book {i}", "Bench Author", f"B{size}-{i}") for i in range(ops)]
+    results["add"] = measure(inv.add_book, [(b,) for b in new_books])
+
+    available = [b.isbn for b in new_books]
+    rng.shuffle(available)
+
+    def issue_return(isbn):
+        inv.issue_book(isbn)
+        inv.return_book(isbn)
+
+    results["issue_return"] = measure(issue_return, [(i,) for i in available])
+
+    saves = [()] * 3
+    results["save"] = measure(inv.save_data, saves)
+    results["save"]["bytes"] = os.path.getsize(file)
+
+    inv.close()
+    results["peak_rss_mb"] = peak_rss_mb()
+    return results
+
+
+def run_single(size, ops):
+    workdir = tempfile.mkdtemp(prefix=f"library-bench-{size}-")
+    try:
+        print(json.dumps(bench_size(size, ops, workdir)))
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                              text=True, cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+    except OSError:
+        return None
+
+
+def compare(current, baseline_path, threshold):
+    with open(baseline_path) as f:
+        baseline = {r["size"]: r for r in json.load(f)["results"]}
+
+    regressions = []
+    for result in current:
+        old = baseline.get(result["size"])
+        if not old:
+            continue
+        for op, stats in result.items():
+            if not isinstance(stats, dict) or op not in old:
+                continue
+            for key in HIGHER_IS_WORSE:
+                if key in stats and old[op].get(key):
+                    change = stats[key] / old[op][key] - 1
+                    if change > threshold:
+                        regressions.append(f"{result['size']:>9} {op:<14} {key:<8} "
+                                           f"{old[op][key]:>10} -> {stats[key]:<10} (+{change:.0%})")
+        if result["peak_rss_mb"] > old["peak_rss_mb"] * (1 + threshold):
+            regressions.append(f"{result['size']:>9} peak_rss_mb {old['peak_rss_mb']} -> {result['peak_rss_mb']}")
+    return regressions
+
+
+def print_table(results):
+    print(f"{'Size':>9} {'Operation':<14} {'ops/s':>12} {'p50 ms':>10} {'p99 ms':>10}")
+    for result in results:
+        print(f"{result['size']:>9} {'load':<14} {'':>12} {result['load']['seconds'] * 1000:>10.1f} {'':>10}")
+        for op in ("isbn_lookup", "title_search", "ranked_search", "add", "issue_return", "save"):
+            s = result[op]
+            print(f"{result['size']:>9} {op:<14} {s['ops_per_sec']:>12.1f} {s['p50_ms']:>10.4f} {s['p99_ms']:>10.4f}")
+        print(f"{result['size']:>9} {'peak RSS':<14} {result['peak_rss_mb']:>10.1f} MB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="LibraryInventory benchmark suite")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000, 1000000])
+    parser.add_argument("--ops", type=int, default=2000, help="operations timed per benchmark")
+    parser.add_argument("--output", default="bench_results.json")
+    parser.add_argument("--compare", metavar="BASELINE", help="earlier results file to check against")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="relative slowdown counted as a regression (default 0.2)")
+    parser.add_argument("--single", type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.single:
+        run_single(args.single, args.ops)
+        return
+
+    # Each size runs in a fresh process so peak RSS belongs to that size alone.
+    results = []
+    for size in args.sizes:
+        print(f"Benchmarking {size} books...", file=sys.stderr)
+        out = subprocess.run([sys.executable, os.path.abspath(__file__), "--single", str(size),
+                              "--ops", str(args.ops)], capture_output=True, text=True, check=True)
+        results.append(json.loads(out.stdout.strip().splitlines()[-1]))
+
+    report = {
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "ops": args.ops,
+        "results": results,
+    }
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+
+    print_table(results)
+    print(f"\nResults written to {args.output}")
+
+    if args.compare:
+        regressions = compare(results, args.compare, args.threshold)
+        if regressions:
+            print("\nRegressions:")
+            for line in regressions:
+                print("  " + line)
+            sys.exit(1)
+        print("\nNo regressions against", args.compare)
+
+
+if __name__ == "__main__":
+    main()
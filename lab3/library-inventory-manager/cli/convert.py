@@ -0,0 +1,42 @@
+# --------------------------------------------------------------------
+# Name        : Adarsh Rathore
+# Roll No     : <2501410014>
+# Course      : B.Tech CSE (Cyber Security)
+# Semester    : 1st Semester
+# Subject     : Programming for Problem Solving Using Python
+# File        : convert.py
+# Project     : Library Inventory Manager
+# --------------------------------------------------------------------
+
+
+import sys
+import os
+import argparse
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from library_manager.binary_inventory import json_to_binary, binary_to_json
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Convert between data.json/data.jsonl and the binary catalogue (.bin)")
+    parser.add_argument("source")
+    parser.add_argument("target")
+    args = parser.parse_args()
+
+    if not os.path.exists(args.source):
+        parser.error(f"{args.source} not found")
+
+    if args.target.lower().endswith(".bin"):
+        count, skipped = json_to_binary(args.source, args.target)
+        print(f"Wrote {count} books to {args.target}"
+              + (f" ({skipped} duplicate or bad records skipped)." if skipped else "."))
+    elif args.source.lower().endswith(".bin"):
+        binary_to_json(args.source, args.target)
+        print(f"Wrote {args.target}.")
+    else:
+        parser.error("one of the two files must end in .bin")
+
+
+if __name__ == "__main__":
+    main()
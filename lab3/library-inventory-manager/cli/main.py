@@ -11,14 +11,146 @@
 
 import sys
 import os
+import argparse
+from datetime import datetime, timedelta
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from library_manager.inventory import LibraryInventory
+from library_manager.sqlite_inventory import SqliteInventory
+from library_manager.binary_inventory import BinaryInventory
 from library_manager.book import Book
+from library_manager import storage
+from library_manager.logs import setup_logging
+from library_manager.metrics import metrics
+
+PAGE_SIZE = 10
+
+
+def open_inventory():
+    parser = argparse.ArgumentParser(description="Library Inventory Manager")
+    parser.add_argument("--sqlite", metavar="DB",
+                        help="store books in this SQLite database instead of data.jsonl")
+    parser.add_argument("--binary", metavar="FILE",
+                        help="use a memory-mapped binary catalogue (see cli/convert.py)")
+    parser.add_argument("--import-json", metavar="FILE",
+                        help="copy books from a data.json/data.jsonl file into the SQLite database")
+    parser.add_argument("--log-json", action="store_true",
+                        help="write library.log as one JSON object per line")
+    parser.add_argument("--log-search-sample", type=float, default=1.0, metavar="RATE",
+                        help="fraction of search events to log (default: all)")
+    parser.add_argument("--metrics", action="store_true",
+                        help="collect operation counts and latencies from startup")
+    parser.add_argument("--title-cache", type=int, default=256, metavar="SIZE",
+                        help="title searches to keep cached, 0 to turn off (default: 256)")
+    args = parser.parse_args()
+
+    metrics.enable(args.metrics)
+
+    setup_logging("library.log", json_format=args.log_json,
+                  search_sample_rate=args.log_search_sample)
+
+    if args.import_json and not args.sqlite:
+        parser.error("--import-json needs --sqlite")
+
+    if args.binary:
+        return BinaryInventory(args.binary, loans=True)
+
+    if args.sqlite:
+        inv = SqliteInventory(args.sqlite)
+        if args.import_json:
+            count, skipped = inv.import_json(args.import_json)
+            print(f"Imported {count} books from {args.import_json}"
+                  + (f" ({skipped} bad records skipped)." if skipped else "."))
+        return inv
+
+    return LibraryInventory(journal=True, title_cache_size=args.title_cache, loans=True)
+
+
+def metrics_menu():
+    print("\n--- Metrics & Profiling ---")
+    print(f"a. {'Disable' if metrics.enabled else 'Enable'} metrics")
+    print("b. Show metrics")
+    print("c. Save metrics to file")
+    print(f"d. {'Stop' if metrics.profiler else 'Start'} cProfile capture")
+    print("e. Start / stop tracemalloc capture")
+    print("f. Reset metrics")
+
+    choice = input("Enter your choice: ").strip().lower()
+
+    if choice == "a":
+        metrics.enable(not metrics.enabled)
+        print("Metrics enabled." if metrics.enabled else "Metrics disabled.")
+    elif choice == "b":
+        print(metrics.report())
+    elif choice == "c":
+        path = input("Enter file name (e.g. metrics.json): ").strip() or "metrics.json"
+        metrics.dump(path)
+        print(f"Metrics saved to {path}")
+    elif choice == "d":
+        if metrics.profiler:
+            path = input("Save raw profile to (Enter to skip): ").strip()
+            print(metrics.stop_profiling(path=path or None))
+        else:
+            metrics.start_profiling()
+            print("Profiling started.")
+    elif choice == "e":
+        report = metrics.stop_tracemalloc()
+        if report:
+            print(report)
+        else:
+            metrics.start_tracemalloc()
+            print("Memory tracing started.")
+    elif choice == "f":
+        metrics.reset()
+        print("Metrics reset.")
+    else:
+        print("Invalid choice.")
+
+
+def read_date(prompt):
+    text = input(prompt).strip()
+    try:
+        return datetime.strptime(text, "%Y-%m-%d")
+    except ValueError:
+        print("Please use the YYYY-MM-DD format.")
+        return None
+
+
+def loans_menu(inv):
+    print("\n--- Loan Reports ---")
+    print("a. Overdue books")
+    print("b. Loans issued between two dates")
+    print("c. Most borrowed books")
+
+    choice = input("Enter your choice: ").strip().lower()
+
+    if choice == "a":
+        loans = inv.overdue_loans()
+        for loan in loans:
+            print(f"{loan} ({(datetime.now() - loan.due).days} days late)")
+        if not loans:
+            print("No overdue books.")
+    elif choice == "b":
+        start = read_date("From (YYYY-MM-DD): ")
+        end = start and read_date("To (YYYY-MM-DD): ")
+        if start and end:
+            loans = inv.loans_between(start, end + timedelta(days=1, seconds=-1))
+            for loan in loans:
+                print(loan)
+            if not loans:
+                print("No loans in that period.")
+    elif choice == "c":
+        ranking = inv.most_borrowed(10)
+        for i, (book, count) in enumerate(ranking, start=1):
+            print(f"{i}) {book} - borrowed {count} times")
+        if not ranking:
+            print("No loans recorded yet.")
+    else:
+        print("Invalid choice.")
 
 
 def main():
-    inv = LibraryInventory()
+    inv = open_inventory()
     
     while True:
         print("\n--- Library Menu ---")
@@ -28,7 +160,11 @@ def main():
         print("4. Search by Title")
         print("5. Search by ISBN")
         print("6. Show All Books")
-        print("7. Exit")
+        print("7. Ranked Search (title/author)")
+        print("8. Import Books (CSV / JSON Lines)")
+        print("9. Metrics & Profiling")
+        print("10. Loan Reports")
+        print("11. Exit")
 
         choice = input("Enter your choice: ")
 
@@ -50,8 +186,8 @@ def main():
 
             if book:
                 if book.status == "available":
-                    book.issue()
-                    inv.save_data()
+                    borrower = input("Enter borrower name: ").strip()
+                    inv.issue_book(isbn, borrower)
                     print("Book issued!")
                 else:
                     print("Book already issued.")
@@ -64,8 +200,7 @@ def main():
 
             if book:
                 if book.status == "issued":
-                    book.return_book()
-                    inv.save_data()
+                    inv.return_book(isbn)
                     print("Book returned!")
                 else:
                     print("Book is not issued.")
@@ -92,12 +227,65 @@ def main():
                 print("Book not found.")
 
         elif choice == "6":
-            all_books = inv.show_all()
-            for b in all_books:
-                print(b)
+            status = input("Filter by status (available/issued, Enter for all): ").strip().lower()
+            author = input("Filter by author (Enter for all): ").strip()
+            cursor = None
+            shown = 0
+
+            while True:
+                books, cursor = inv.page(limit=PAGE_SIZE, status=status or None,
+                                         author=author or None, cursor=cursor)
+                for b in books:
+                    shown += 1
+                    print(f"{shown}) {b}")
+
+                if cursor is None:
+                    break
+                more = input("Press Enter for the next page or 'q' to stop: ").strip().lower()
+                if more == "q":
+                    break
+
+            if shown == 0:
+                print("No books found.")
 
         elif choice == "7":
+            query = input("Enter words to search: ")
+            results = inv.search(query)
+
+            if results:
+                for b, score in results:
+                    print(f"[{score:.2f}] {b}")
+            else:
+                print("No books found.")
+
+        elif choice == "8":
+            path = input("Enter file to import: ")
+
+            if not os.path.exists(path):
+                print("File not found.")
+                continue
+
+            try:
+                report = inv.add_books(storage.iter_book_file(path))
+            except Exception as e:
+                print("Error: ", e)
+                continue
+
+            added = sum(1 for _, ok, _ in report if ok)
+            print(f"Imported {added} of {len(report)} books.")
+            for isbn, ok, message in report:
+                if not ok:
+                    print(f"  ISBN {isbn}: {message}")
+
+        elif choice == "9":
+            metrics_menu()
+
+        elif choice == "10":
+            loans_menu(inv)
+
+        elif choice == "11":
             print("Exiting program...")
+            inv.close()
             break
 
         else:
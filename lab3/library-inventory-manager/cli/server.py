@@ -0,0 +1,231 @@
+# --------------------------------------------------------------------
+# Name        : Adarsh Rathore
+# Roll No     : <2501410014>
+# Course      : B.Tech CSE (Cyber Security)
+# Semester    : 1st Semester
+# Subject     : Programming for Problem Solving Using Python
+# File        : server.py
+# Project     : Library Inventory Manager
+# --------------------------------------------------------------------
+
+
+import sys
+import os
+import json
+import asyncio
+import argparse
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit, parse_qs
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from library_manager.inventory import LibraryInventory
+from library_manager.logs import setup_logging, stop_logging
+
+REASONS = {200: "OK", 201: "Created", 400: "Bad Request", 404: "Not Found",
+           405: "Method Not Allowed", 409: "Conflict", 500: "Internal Server Error"}
+MAX_BODY = 1024 * 1024
+
+
+class HttpError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+class LibraryServer:
+    def __init__(self, inv, workers=8):
+        self.inv = inv
+        # Every inventory call runs on these threads, since writes wait on
+        # disk and searches and listings can walk the whole catalogue; the
+        # event loop keeps serving other clients. The inventory is thread safe.
+        self.executor = ThreadPoolExecutor(max_workers=workers)
+
+    async def run_blocking(self, func, *args):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, func, *args)
+
+    async def handle_client(self, reader, writer):
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b"\r\n\r\n")
+                except asyncio.LimitOverrunError:
+                    await self.respond(writer, 400, {"error": "Request headers too long."}, False)
+                    break
+                except (asyncio.IncompleteReadError, ConnectionError):
+                    break
+
+                lines = head.decode("latin-1").split("\r\n")
+                try:
+                    method, target, version = lines[0].split(" ", 2)
+                except ValueError:
+                    await self.respond(writer, 400, {"error": "Malformed request line."}, False)
+                    break
+
+                headers = {}
+                for line in lines[1:]:
+                    if ":" in line:
+                        name, value = line.split(":", 1)
+                        headers[name.strip().lower()] = value.strip()
+
+                try:
+                    length = int(headers.get("content-length", 0) or 0)
+                except ValueError:
+                    length = -1
+                if not 0 <= length <= MAX_BODY:
+                    await self.respond(writer, 400, {"error": "Bad or too large request body."}, False)
+                    break
+                try:
+                    body = await reader.readexactly(length) if length else b""
+                except asyncio.IncompleteReadError:
+                    await self.respond(writer, 400, {"error": "Request body shorter than Content-Length."}, False)
+                    break
+
+                keep_alive = headers.get("connection", "").lower() != "close" and version == "HTTP/1.1"
+
+                try:
+                    status, payload = await self.dispatch(method, target, body)
+                except HttpError as e:
+                    status, payload = e.status, {"error": str(e)}
+                except Exception as e:
+                    logging.error(f"Server error on {method} {target}: {e}")
+                    status, payload = 500, {"error": "Internal server error."}
+
+                await self.respond(writer, status, payload, keep_alive)
+                if not keep_alive:
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def respond(self, writer, status, payload, keep_alive):
+        data = json.dumps(payload).encode()
+        head = (f"HTTP/1.1 {status} {REASONS.get(status, '')}\r\n"
+                f"Content-Type: application/json\r\n"
+                f"Content-Length: {len(data)}\r\n"
+                f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n")
+        writer.write(head.encode() + data)
+        await writer.drain()
+
+    async def dispatch(self, method, target, body):
+        url = urlsplit(target)
+        parts = [p for p in url.path.split("/") if p]
+        query = {k: v[-1] for k, v in parse_qs(url.query).items()}
+
+        if parts == ["books"]:
+            if method == "GET":
+                return 200, await self.run_blocking(self.list_books, query)
+            if method == "POST":
+                return await self.add_book(body)
+
+        elif len(parts) == 2 and parts[0] == "books":
+            if method == "GET":
+                book = await self.run_blocking(self.inv.search_isbn, parts[1])
+                if book is None:
+                    raise HttpError(404, "Book not found.")
+                return 200, book.to_dict()
+
+        elif len(parts) == 3 and parts[0] == "books" and parts[2] in ("issue", "return"):
+            if method == "POST":
+                return await self.change_status(parts[1], parts[2])
+
+        elif parts == ["search"]:
+            if method == "GET":
+                return 200, await self.run_blocking(self.search, query)
+
+        else:
+            raise HttpError(404, "Unknown path.")
+
+        raise HttpError(405, "Method not allowed.")
+
+    def list_books(self, query):
+        offset = self.int_param(query, "offset", 0)
+        limit = self.int_param(query, "limit", 50, minimum=1)
+        cursor = self.int_param(query, "cursor", 0) if "cursor" in query else None
+        books, next_cursor = self.inv.page(offset, limit, query.get("status"),
+                                           query.get("author"), cursor)
+        return {"books": [b.to_dict() for b in books], "next_cursor": next_cursor}
+
+    def search(self, query):
+        limit = self.int_param(query, "limit", 10, minimum=1)
+        if "title" in query:
+            books = self.inv.search_title(query["title"])[:limit]
+            return {"results": [b.to_dict() for b in books]}
+
+        results = self.inv.search(query.get("q", ""), limit)
+        return {"results": [dict(b.to_dict(), score=round(score, 4)) for b, score in results]}
+
+    async def add_book(self, body):
+        try:
+            item = json.loads(body or b"{}")
+        except json.JSONDecodeError:
+            raise HttpError(400, "Body must be JSON.")
+        if not isinstance(item, dict):
+            raise HttpError(400, "Body must be a JSON object.")
+        item.setdefault("status", "available")
+
+        isbn, ok, message = (await self.run_blocking(self.inv.add_books, [item]))[0]
+        if not ok:
+            raise HttpError(409 if "exists" in message else 400, message)
+        return 201, {"isbn": isbn, "result": message}
+
+    async def change_status(self, isbn, action):
+        func = self.inv.issue_book if action == "issue" else self.inv.return_book
+        try:
+            book = await self.run_blocking(func, isbn)
+        except KeyError:
+            raise HttpError(404, "Book not found.")
+        except ValueError as e:
+            raise HttpError(409, str(e))
+        return 200, book.to_dict()
+
+    @staticmethod
+    def int_param(query, name, default, minimum=0):
+        try:
+            value = int(query.get(name, default))
+        except ValueError:
+            raise HttpError(400, f"'{name}' must be a whole number.")
+        if value < minimum:
+            if minimum == 0:
+                raise HttpError(400, f"'{name}' cannot be negative.")
+            raise HttpError(400, f"'{name}' must be at least {minimum}.")
+        return value
+
+
+async def serve(host, port, inv):
+    app = LibraryServer(inv)
+    server = await asyncio.start_server(app.handle_client, host, port)
+    print(f"Library service listening on http://{host}:{port}")
+    logging.info(f"HTTP service started on {host}:{port}")
+    async with server:
+        await server.serve_forever()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Library Inventory HTTP/JSON service")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--file", default="data.jsonl")
+    parser.add_argument("--log-json", action="store_true",
+                        help="write library.log as one JSON object per line")
+    parser.add_argument("--log-search-sample", type=float, default=0.1, metavar="RATE",
+                        help="fraction of search events to log (default: 0.1)")
+    args = parser.parse_args()
+
+    setup_logging("library.log", json_format=args.log_json,
+                  search_sample_rate=args.log_search_sample)
+
+    inv = LibraryInventory(file=args.file, journal=True)
+    try:
+        asyncio.run(serve(args.host, args.port, inv))
+    except KeyboardInterrupt:
+        print("Shutting down...")
+    finally:
+        inv.close()
+        stop_logging()
+
+
+if __name__ == "__main__":
+    main()
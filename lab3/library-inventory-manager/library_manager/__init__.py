@@ -1 +1,6 @@
 # Package initializer for library_manager
+
+import logging
+
+# The application decides where logs go (see library_manager.logs).
+logging.getLogger(__name__).addHandler(logging.NullHandler())
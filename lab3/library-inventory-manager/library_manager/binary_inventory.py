@@ -0,0 +1,440 @@
+# --------------------------------------------------------------------
+# Name        : Adarsh Rathore
+# Roll No     : <2501410014>
+# Course      : B.Tech CSE (Cyber Security)
+# Semester    : 1st Semester
+# Subject     : Programming for Problem Solving Using Python
+# File        : binary_inventory.py
+# Project     : Library Inventory Manager
+# --------------------------------------------------------------------
+
+
+from library_manager.book import Book
+from library_manager import storage
+from library_manager.loans import LoanHistory, LOAN_DAYS
+from library_manager.logs import SEARCH_EVENT
+from library_manager.metrics import timed
+from library_manager.search import tokenize
+import os
+import sys
+import mmap
+import array
+import struct
+import logging
+import threading
+
+log = logging.getLogger(__name__)
+
+# File layout, all little-endian:
+#   header | record table | ISBN index | string heap
+# Each record is fixed width, so record n sits at a known offset and its
+# strings are (offset, length) pairs into the heap. The index lists record
+# numbers sorted by ISBN for binary search.
+MAGIC = b"LIBCAT\x00\x01"
+HEADER = struct.Struct("<8sIQQQ")
+RECORD = struct.Struct("<5IHBx")
+STATUS_OFFSET = 22
+INDEX_ENTRY = 4
+
+STATUSES = ("available", "issued")
+STATUS_CODES = {name: code for code, name in enumerate(STATUSES)}
+
+
+def write_catalogue(path, records):
+    # Returns (books written, duplicate ISBNs skipped, bad records skipped).
+    # Records go through Book, so "Issued" or " available " are accepted.
+    heap = bytearray()
+    table = bytearray()
+    keys = []
+    seen = set()
+    skipped = 0
+    invalid = 0
+
+    def put(text):
+        data = str(text).encode("utf-8")
+        offset = len(heap)
+        heap.extend(data)
+        return offset, len(data)
+
+    for item in records:
+        try:
+            book = Book(item["title"], item["author"], item["isbn"], item.get("status") or "available")
+            if not all(isinstance(v, str) for v in (book.title, book.author, book.isbn)):
+                raise TypeError("title, author and isbn must be text")
+        except (KeyError, TypeError, ValueError, AttributeError) as e:
+            isbn = item.get("isbn") if isinstance(item, dict) else item
+            log.warning(f"Skipping bad book record {isbn!r}: {e}")
+            invalid += 1
+            continue
+
+        isbn = book.isbn
+        if isbn in seen:
+            skipped += 1
+            continue
+        seen.add(isbn)
+
+        status = STATUS_CODES[book.status]
+        title, author, key = put(book.title), put(book.author), put(isbn)
+        keys.append((isbn.encode("utf-8"), len(keys)))
+        table.extend(RECORD.pack(*title, *author, *key, status))
+
+    keys.sort()
+    index = array.array("I", (n for _, n in keys))
+    if sys.byteorder == "big":
+        index.byteswap()
+
+    records_offset = HEADER.size
+    index_offset = records_offset + len(table)
+    heap_offset = index_offset + len(keys) * INDEX_ENTRY
+
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(HEADER.pack(MAGIC, len(keys), records_offset, index_offset, heap_offset))
+        f.write(table)
+        f.write(index.tobytes())
+        f.write(heap)
+    os.replace(tmp, path)
+    return len(keys), skipped, invalid
+
+
+def json_to_binary(source, target):
+    # Returns (books written, records skipped as duplicates or invalid).
+    count, duplicates, invalid = write_catalogue(target, storage.iter_records(source))
+    log.info(f"Converted {source} to binary catalogue {target}: {count} books, "
+             f"{duplicates} duplicates and {invalid} bad records skipped.")
+    return count, duplicates + invalid
+
+
+def binary_to_json(source, target):
+    inv = BinaryInventory(source)
+    try:
+        written = storage.write_records(target, inv.iter_records())
+    finally:
+        inv.close()
+    log.info(f"Converted binary catalogue {source} to {target}.")
+    return written
+
+
+class BinaryInventory:
+    def __init__(self, file="catalogue.bin", loans=False, loan_days=LOAN_DAYS):
+        self.file = file
+        # Adding books closes and remaps the file, so every read of the map
+        # holds the lock too; scans take it one record at a time.
+        self.lock = threading.RLock()
+        self.handle = None
+        self.mm = None
+
+        if not os.path.exists(file):
+            log.warning("Binary catalogue not found. Starting with an empty one.")
+            write_catalogue(file, [])
+        self.load_data()
+
+        self.loans = None
+        if loans:
+            self.loans = LoanHistory(os.path.splitext(file)[0] + ".loans", loan_days)
+            self.loans.open()
+
+    @timed("load_data")
+    def load_data(self):
+        # Only the header is read; record pages come in as they are touched.
+        self._unmap()
+        self.handle = open(self.file, "r+b")
+        self.mm = mmap.mmap(self.handle.fileno(), 0)
+
+        magic, self.count, self.records_offset, self.index_offset, self.heap_offset = \
+            HEADER.unpack_from(self.mm, 0)
+        if magic != MAGIC:
+            self._unmap()
+            raise ValueError(f"{self.file} is not a library binary catalogue.")
+        log.info(f"Binary catalogue opened: {self.file} ({self.count} books)")
+
+    def _unmap(self):
+        if self.mm is not None:
+            self.mm.close()
+            self.mm = None
+        if self.handle is not None:
+            self.handle.close()
+            self.handle = None
+
+    def _text(self, offset, length):
+        start = self.heap_offset + offset
+        return self.mm[start:start + length].decode("utf-8")
+
+    def _book(self, n):
+        t_off, t_len, a_off, a_len, i_off, i_len, status = RECORD.unpack_from(
+            self.mm, self.records_offset + n * RECORD.size)
+        return Book(self._text(t_off, t_len), self._text(a_off, a_len),
+                    self._text(i_off, i_len), STATUSES[status])
+
+    def _isbn_at(self, n):
+        _, _, _, _, offset, length, _ = RECORD.unpack_from(self.mm, self.records_offset + n * RECORD.size)
+        start = self.heap_offset + offset
+        return self.mm[start:start + length]
+
+    def _find(self, isbn):
+        # Binary search over the sorted index; touches about log2(n) pages.
+        key = isbn.encode("utf-8")
+        lo, hi = 0, self.count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            n = int.from_bytes(self.mm[self.index_offset + mid * INDEX_ENTRY:
+                                       self.index_offset + (mid + 1) * INDEX_ENTRY], "little")
+            found = self._isbn_at(n)
+            if found == key:
+                return n
+            if found < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return None
+
+    def _set_status(self, isbn, old, new):
+        with self.lock:
+            n = self._find(isbn)
+            if n is None:
+                raise KeyError("Book not found.")
+
+            pos = self.records_offset + n * RECORD.size + STATUS_OFFSET
+            if self.mm[pos] != STATUS_CODES[old]:
+                if new == "issued":
+                    raise ValueError("This book is already issued.")
+                raise ValueError("This book is not issued.")
+            # Flip the one byte in place and write back just its page.
+            self.mm[pos] = STATUS_CODES[new]
+            start = pos - pos % mmap.ALLOCATIONGRANULARITY
+            self.mm.flush(start, pos - start + 1)
+            return self._book(n)
+
+    def _iter_books(self, start=0):
+        # Adds only append records, so record n stays the same book across
+        # a remap and the scan can pick up where it was.
+        n = start
+        while True:
+            with self.lock:
+                if n >= self.count:
+                    return
+                book = self._book(n)
+            yield book
+            n += 1
+
+    def iter_records(self):
+        for book in self._iter_books():
+            yield book.to_dict()
+
+    def _rewrite(self, new_books):
+        # Records and the index are fixed in place, so adding books writes a
+        # new file; issue and return never do.
+        records = list(self.iter_records())
+        existing = {r["isbn"] for r in records}
+        report = []
+
+        for book in new_books:
+            if book.isbn in existing:
+                report.append((book.isbn, False, "Book with this ISBN already exists."))
+                continue
+            existing.add(book.isbn)
+            records.append(book.to_dict())
+            report.append((book.isbn, True, "added"))
+
+        if any(ok for _, ok, _ in report):
+            self._unmap()
+            try:
+                write_catalogue(self.file, records)
+            finally:
+                self.load_data()
+        return report
+
+    @timed("add_book")
+    def add_book(self, book):
+        try:
+            with self.lock:
+                isbn, ok, message = self._rewrite([book])[0]
+            if not ok:
+                log.error("Duplicate ISBN found while adding a book.")
+                raise ValueError(message)
+            log.info(f"Book added: {book.title}, {book.author}, {book.isbn}")
+
+        except Exception as e:
+            log.error(f"Error adding book: {e}")
+            print("Error:", e)
+
+    @timed("add_books")
+    def add_books(self, items):
+        report = []
+        books = []
+
+        for item in items:
+            try:
+                books.append(item if isinstance(item, Book) else Book(
+                    item["title"], item["author"], item["isbn"], item["status"]))
+                report.append(None)
+            except (KeyError, TypeError, ValueError) as e:
+                isbn = item.get("isbn") if isinstance(item, dict) else None
+                report.append((isbn, False, f"Invalid record: {e}"))
+
+        with self.lock:
+            results = iter(self._rewrite(books))
+        report = [result or next(results) for result in report]
+
+        added = sum(1 for _, ok, _ in report if ok)
+        log.info(f"Bulk add: {added} of {len(report)} books added.")
+        return report
+
+    @timed("issue_book")
+    def issue_book(self, isbn, borrower=None):
+        book = self._set_status(isbn, "available", "issued")
+        if self.loans:
+            self.loans.issue(isbn, borrower)
+        log.info(f"Book issued: {isbn}")
+        return book
+
+    @timed("return_book")
+    def return_book(self, isbn):
+        book = self._set_status(isbn, "issued", "available")
+        if self.loans:
+            self.loans.return_loan(isbn)
+        log.info(f"Book returned: {isbn}")
+        return book
+
+    def _change_many(self, isbns, op, borrower=None):
+        report = []
+        for isbn in isbns:
+            try:
+                if op == "issue":
+                    self.issue_book(isbn, borrower)
+                else:
+                    self.return_book(isbn)
+            except (KeyError, ValueError) as e:
+                report.append((isbn, False, e.args[0]))
+                continue
+            report.append((isbn, True, "issued" if op == "issue" else "returned"))
+
+        changed = sum(1 for _, ok, _ in report if ok)
+        log.info(f"Bulk {op}: {changed} of {len(report)} books changed.")
+        return report
+
+    @timed("issue_many")
+    def issue_many(self, isbns, borrower=None):
+        return self._change_many(isbns, "issue", borrower)
+
+    @timed("return_many")
+    def return_many(self, isbns):
+        return self._change_many(isbns, "return")
+
+    def _search(self, field, name):
+        # No text index in this format, so substring searches read every record.
+        name = name.lower()
+        results = []
+        for book in self._iter_books():
+            if name in getattr(book, field).lower():
+                results.append(book)
+        return results
+
+    @timed("search_title")
+    def search_title(self, name):
+        results = self._search("title", name)
+        log.info(f"Title search performed for: {name.lower()}", extra=SEARCH_EVENT)
+        return results
+
+    @timed("search_author")
+    def search_author(self, name):
+        results = self._search("author", name)
+        log.info(f"Author search performed for: {name.lower()}", extra=SEARCH_EVENT)
+        return results
+
+    @timed("search")
+    def search(self, query, limit=10):
+        # Books matching every word, titles before authors.
+        terms = tokenize(query)
+        scored = []
+        for book in self._iter_books():
+            title, author = tokenize(book.title), tokenize(book.author)
+            score = 0.0
+            for term in terms:
+                hit = 2.0 * sum(w.startswith(term) for w in title) + sum(w.startswith(term) for w in author)
+                if not hit:
+                    break
+                score += hit
+            else:
+                if terms:
+                    scored.append((book, score))
+
+        scored.sort(key=lambda item: item[1], reverse=True)
+        log.info(f"Ranked search performed for: {query}", extra=SEARCH_EVENT)
+        return scored[:limit]
+
+    @timed("search_isbn")
+    def search_isbn(self, number):
+        with self.lock:
+            n = self._find(number)
+            book = None if n is None else self._book(n)
+        if book is not None:
+            log.info(f"ISBN search found: {number}", extra=SEARCH_EVENT)
+            return book
+
+        log.warning(f"ISBN search failed for: {number}", extra=SEARCH_EVENT)
+        return None
+
+    def show_all(self):
+        for n, book in enumerate(self._iter_books(), start=1):
+            yield f"{n}) {book}"
+
+    @timed("page")
+    def page(self, offset=0, limit=20, status=None, author=None, cursor=None):
+        # The cursor is the record number to resume from.
+        if limit < 1:
+            raise ValueError("Page limit must be at least 1.")
+        if offset < 0 or (cursor is not None and cursor < 0):
+            raise ValueError("Page offset and cursor cannot be negative.")
+        start = 0 if cursor is None else cursor
+        if not status and not author:
+            start += offset
+            offset = 0
+
+        books = []
+        for n, book in enumerate(self._iter_books(start), start=start):
+            if status and book.status != status:
+                continue
+            if author and author.lower() not in book.author.lower():
+                continue
+            if offset:
+                offset -= 1
+                continue
+            if len(books) == limit:
+                return books, n
+            books.append(book)
+
+        return books, None
+
+    @timed("save_data")
+    def save_data(self):
+        # Status flips are already written through; this only forces the sync.
+        with self.lock:
+            self.mm.flush()
+
+    def overdue_loans(self, now=None):
+        if self.loans is None:
+            return []
+        return self.loans.overdue(now)
+
+    def loans_between(self, start, end):
+        if self.loans is None:
+            return []
+        return self.loans.between(start, end)
+
+    def most_borrowed(self, limit=10):
+        if self.loans is None:
+            return []
+        results = []
+        with self.lock:
+            for isbn, count in self.loans.most_borrowed(limit):
+                n = self._find(isbn)
+                if n is not None:
+                    results.append((self._book(n), count))
+        return results
+
+    def close(self):
+        if self.loans:
+            self.loans.close()
+        with self.lock:
+            self._unmap()
@@ -9,13 +9,34 @@
 # --------------------------------------------------------------------
 
 
+from enum import Enum
+
+
+class Status(Enum):
+    AVAILABLE = "available"
+    ISSUED = "issued"
+
+
 class Book:
+    # Slots drop the per-book __dict__; status is one of two shared enum
+    # members instead of a separate string on every book.
+    __slots__ = ("title", "author", "isbn", "_status")
+
     def __init__(self, title, author, isbn, status="available"):
         self.title = title
         self.author = author
         self.isbn = isbn
         self.status = status
 
+    @property
+    def status(self):
+        return self._status.value
+
+    @status.setter
+    def status(self, value):
+        # Hand-edited files may say "Issued" or " available ".
+        self._status = Status(value.strip().lower() if isinstance(value, str) else value)
+
     def __str__(self):
         return f"Title: {self.title} | Author: {self.author} | ISBN: {self.isbn} | Status: {self.status}\n"
 
@@ -30,15 +51,15 @@ class Book:
         }
     
     def is_available(self):
-        return self.status == "available"
+        return self._status is Status.AVAILABLE
     
     def issue(self):
         if not self.is_available():
             raise ValueError("This book is already issued.")
-        self.status = "issued"
+        self._status = Status.ISSUED
     
     def return_book(self):
         if self.is_available():
             raise ValueError("This book is not issued.")
 
-        self.status = "available"
+        self._status = Status.AVAILABLE
@@ -10,105 +10,645 @@
 
 
 from library_manager.book import Book
+from library_manager.journal import Journal
+from library_manager.loans import LoanHistory, LOAN_DAYS
+from library_manager import storage
+from library_manager.logs import SEARCH_EVENT
+from library_manager.metrics import metrics, timed
+from library_manager.search import SearchIndex, tokenize
 import os
 import json
+import time
 import logging
+import threading
+from collections import OrderedDict
+from contextlib import ExitStack
+
+log = logging.getLogger(__name__)
+
+LOCK_STRIPES = 64
+TITLE_CACHE_SIZE = 256
+# A query word matching more than this share of the catalogue narrows too
+# little to be worth collecting; scanning the books in order is cheaper.
+CANDIDATE_SCAN_SHARE = 1 / 16
 
-logging.basicConfig(
-    filename="library.log",
-    level=logging.INFO,
-    format="%(asctime)s - %(levelname)s - %(message)s"
-)
 
 class LibraryInventory:
-    def __init__(self):
+    def __init__(self, file="data.jsonl", journal=False, journal_limit=1000,
+                 lazy=False, legacy_file="data.json", title_cache_size=TITLE_CACHE_SIZE,
+                 loans=False, loan_days=LOAN_DAYS):
         self.books = []
-        self.file = "data.json"
+        self.isbn_index = {}
+        self.search_index = SearchIndex()
+        self._positions = {}
+        self.file = file
+        self.legacy_file = legacy_file
+        self.lazy = lazy
+        self._offsets = None
+        self._lazy_handle = None
+        self.journal = None
+        self.journal_limit = journal_limit
+        self._compactor = None
+
+        # Lowercased title query -> matching books, least recently used first.
+        # Results hold the Book objects themselves, so issue/return show up
+        # without touching the cache; only new books can change a result.
+        self._title_cache = OrderedDict()
+        self.title_cache_size = title_cache_size
+        self.title_cache_hits = 0
+        self.title_cache_misses = 0
+
+        # Issue/return lock only the stripe their ISBN hashes to; _lock guards
+        # the indexes and _save_lock keeps saves and compactions in order.
+        # Always take them in the order stripe -> _save_lock -> journal -> _lock.
+        self._stripes = [threading.Lock() for _ in range(LOCK_STRIPES)]
+        self._lock = threading.RLock()
+        self._save_lock = threading.RLock()
+
+        if journal:
+            self.journal = Journal(os.path.splitext(file)[0] + ".journal")
+
+        # Who borrowed what and when lives beside the catalogue in its own
+        # append-only file; the catalogue only keeps the current status.
+        self.loans = None
+        if loans:
+            self.loans = LoanHistory(os.path.splitext(file)[0] + ".loans", loan_days)
+
+        start = time.perf_counter()
         self.load_data()
+        metrics.set_gauge("load_seconds", time.perf_counter() - start)
+
+        if self.journal:
+            self.journal.open()
+        if self.loans:
+            self.loans.open()
+
+    def _index_book(self, book):
+        # The search index is the step that can fail, so it goes first.
+        self.search_index.add(book)
+        self._positions[book.isbn] = len(self.books)
+        self.books.append(book)
+        self.isbn_index[book.isbn] = book
+        if self._title_cache:
+            self._forget_titles(book.title.lower())
+
+    def _forget_titles(self, title):
+        # Drop only the cached queries the new title would now match.
+        for query in [q for q in self._title_cache if q in title]:
+            del self._title_cache[query]
+
+    def _clear_index(self):
+        self.books = []
+        self.isbn_index = {}
+        self.search_index = SearchIndex()
+        self._positions = {}
+        self._title_cache.clear()
+        self._close_lazy()
+
+    def _close_lazy(self):
+        self._offsets = None
+        if self._lazy_handle:
+            self._lazy_handle.close()
+            self._lazy_handle = None
+
+    def _stripe(self, isbn):
+        return self._stripes[hash(isbn) % LOCK_STRIPES]
+
+    def _lock_stripes(self, isbns):
+        # Bulk operations take every stripe they touch, in a fixed order so
+        # two batches can never wait on each other.
+        stack = ExitStack()
+        for i in sorted({hash(isbn) % LOCK_STRIPES for isbn in isbns}):
+            stack.enter_context(self._stripes[i])
+        return stack
+
+    def _get(self, isbn):
+        book = self.isbn_index.get(isbn)
+        if book is not None:
+            return book
+        if not self._offsets:
+            # A lazy load publishes the full index before it drops the
+            # offsets, so if they went in between, the new index has it.
+            return self.isbn_index.get(isbn)
+
+        with self._lock:
+            book = self.isbn_index.get(isbn)
+            if book is not None or not self._offsets:
+                return book
+
+            offset = self._offsets.pop(isbn, None)
+            if offset is None:
+                return None
+
+            book = self._load_book(storage.read_record_at(self._lazy_handle, offset))
+            if book is not None:
+                self._index_book(book)
+            return book
+
+    def _ensure_loaded(self):
+        # Lazy mode only materializes on demand; anything that needs the
+        # whole catalogue reads the rest in file order first.
+        if self._offsets is None:
+            return
+
+        with self._lock:
+            if self._offsets is not None:
+                self._load_rest()
+
+    def _load_rest(self):
+        # _get reads isbn_index without the lock, so the full catalogue is
+        # built aside and swapped in whole; the offsets go last.
+        loaded = dict(self.isbn_index)
+        books = []
+        isbn_index = {}
+        positions = {}
+        search_index = SearchIndex()
 
+        def index(book):
+            search_index.add(book)
+            positions[book.isbn] = len(books)
+            books.append(book)
+            isbn_index[book.isbn] = book
+
+        for item in storage.iter_records(self.file):
+            book = loaded.pop(item.get("isbn"), None) or self._load_book(item)
+            if book is not None and book.isbn not in isbn_index:
+                index(book)
+
+        # Books added since startup are not in the snapshot file yet.
+        for book in loaded.values():
+            index(book)
+
+        self.books, self._positions, self.search_index = books, positions, search_index
+        self.isbn_index = isbn_index
+        self._title_cache.clear()
+        self._close_lazy()
+        log.info("Lazy catalogue fully loaded.")
+
+    @staticmethod
+    def _check_book(book):
+        for field in ("title", "author", "isbn"):
+            if not isinstance(getattr(book, field), str):
+                raise TypeError(f"{field} must be text")
+        return book
+
+    @classmethod
+    def _make_book(cls, item):
+        return cls._check_book(Book(item["title"], item["author"], item["isbn"], item["status"]))
+
+    def _load_book(self, item):
+        # One bad record on disk is skipped rather than failing the load.
+        try:
+            return self._make_book(item)
+        except (KeyError, TypeError, ValueError, AttributeError) as e:
+            log.warning(f"Skipping bad book record {item.get('isbn') if isinstance(item, dict) else item!r}: {e}")
+            return None
+
+    def _candidates(self, field, query):
+        # Every word of a substring query lies inside some indexed word, so
+        # matching query words against the vocabulary narrows the books to check.
+        index = self.search_index.postings[field]
+        limit = len(self.books) * CANDIDATE_SCAN_SHARE
+        candidates = None
+        postings = []
+        for word in set(tokenize(query)):
+            matched = [isbns for token, isbns in index.items() if word in token]
+            if not matched:
+                return []
+            if sum(map(len, matched)) > limit:
+                continue
+            postings.append(matched)
+            found = set().union(*matched)
+            candidates = found if candidates is None else candidates & found
+            if not candidates:
+                return []
+
+        if candidates is None:
+            return self.books
+        if len(postings) == 1 and len(postings[0]) == 1:
+            # Books join a posting as they join the catalogue, so one
+            # posting is already in catalogue order.
+            return [self.isbn_index[i] for i in postings[0][0]]
+        positions = self._positions
+        return [self.books[p] for p in sorted(positions[i] for i in candidates)]
+
+    @timed("add_book")
     def add_book(self, book):
         try:
-            for b in self.books:
-                if b.isbn == book.isbn:
-                    logging.error("Duplicate ISBN found while adding a book.")
-                    raise ValueError("Book with this ISBN already exists.")
+            self._check_book(book)
+            with self._stripe(book.isbn):
+                with self._lock:
+                    if self._get(book.isbn) is not None:
+                        log.error("Duplicate ISBN found while adding a book.")
+                        raise ValueError("Book with this ISBN already exists.")
 
-            self.books.append(book)
-            self.save_data()
-            logging.info(f"Book added: {book.title}, {book.author}, {book.isbn}")
+                    self._index_book(book)
+
+                self._record({"op": "add", **book.to_dict()})
+            log.info(f"Book added: {book.title}, {book.author}, {book.isbn}")
 
         except Exception as e:
-            logging.error(f"Error adding book: {e}")
+            log.error(f"Error adding book: {e}")
             print("Error:", e)
 
+    @timed("issue_book")
+    def issue_book(self, isbn, borrower=None):
+        book = self._get(isbn)
+        if book is None:
+            raise KeyError("Book not found.")
+
+        # The status check, the flip and the journal record happen under one
+        # lock so two desks can never both issue the same copy.
+        with self._stripe(isbn):
+            book.issue()
+            self._record({"op": "issue", "isbn": isbn})
+            if self.loans:
+                self.loans.issue(isbn, borrower)
+        log.info(f"Book issued: {isbn}")
+        return book
+
+    @timed("return_book")
+    def return_book(self, isbn):
+        book = self._get(isbn)
+        if book is None:
+            raise KeyError("Book not found.")
+
+        with self._stripe(isbn):
+            book.return_book()
+            self._record({"op": "return", "isbn": isbn})
+            if self.loans:
+                self.loans.return_loan(isbn)
+        log.info(f"Book returned: {isbn}")
+        return book
+
+    @timed("add_books")
+    def add_books(self, items):
+        self._ensure_loaded()
+        report = []
+        books = []
+
+        for item in items:
+            try:
+                books.append(self._check_book(item) if isinstance(item, Book) else self._make_book(item))
+                report.append(None)
+            except (KeyError, TypeError, ValueError) as e:
+                isbn = item.get("isbn") if isinstance(item, dict) else None
+                report.append((isbn, False, f"Invalid record: {e}"))
+
+        added = []
+        pending = iter(books)
+        with self._lock_stripes([b.isbn for b in books]):
+            with self._lock:
+                for i, result in enumerate(report):
+                    if result is not None:
+                        continue
+
+                    book = next(pending)
+                    if book.isbn in self.isbn_index:
+                        report[i] = (book.isbn, False, "Book with this ISBN already exists.")
+                        continue
+
+                    self._index_book(book)
+                    added.append({"op": "add", **book.to_dict()})
+                    report[i] = (book.isbn, True, "added")
+
+            if added:
+                self._record(*added)
+        log.info(f"Bulk add: {len(added)} of {len(report)} books added.")
+        return report
+
+    def _change_many(self, isbns, op, borrower=None):
+        isbns = list(isbns)
+        report = []
+        changed = []
+
+        with self._lock_stripes(isbns):
+            for isbn in isbns:
+                book = self._get(isbn)
+                if book is None:
+                    report.append((isbn, False, "Book not found."))
+                    continue
+
+                try:
+                    if op == "issue":
+                        book.issue()
+                    else:
+                        book.return_book()
+                except ValueError as e:
+                    report.append((isbn, False, str(e)))
+                    continue
+
+                changed.append({"op": op, "isbn": isbn})
+                if self.loans:
+                    if op == "issue":
+                        self.loans.issue(isbn, borrower)
+                    else:
+                        self.loans.return_loan(isbn)
+                report.append((isbn, True, "issued" if op == "issue" else "returned"))
+
+            if changed:
+                self._record(*changed)
+        log.info(f"Bulk {op}: {len(changed)} of {len(report)} books changed.")
+        return report
+
+    @timed("issue_many")
+    def issue_many(self, isbns, borrower=None):
+        return self._change_many(isbns, "issue", borrower)
+
+    @timed("return_many")
+    def return_many(self, isbns):
+        return self._change_many(isbns, "return")
+
+    def _record(self, *entries):
+        if self.journal is None:
+            self.save_data()
+            return
+
+        self.journal.append(*entries)
+        if self.journal.count >= self.journal_limit:
+            self.compact(background=True)
+
+    def _apply(self, entry):
+        # Returns False for a record that cannot be applied, so the caller
+        # can skip it; one bad line must not cost the rest of the catalogue.
+        if not isinstance(entry, dict) or not isinstance(entry.get("isbn"), str):
+            return False
+        op = entry.get("op")
+        if op == "add":
+            if self._get(entry.get("isbn")) is None:
+                book = self._load_book(entry)
+                if book is None:
+                    return False
+                self._index_book(book)
+        elif op in ("issue", "return"):
+            # Set the status directly so replaying a record twice is harmless.
+            book = self._get(entry.get("isbn"))
+            if book:
+                book.status = "issued" if op == "issue" else "available"
+        else:
+            return False
+        return True
+
+    @timed("compact")
+    def compact(self, background=False):
+        if self.journal is None:
+            self.save_data()
+            return
+
+        with self._save_lock:
+            if self._compactor and self._compactor.is_alive():
+                if not background:
+                    self._compactor.join()
+                else:
+                    return
+
+            self._ensure_loaded()
+            # Snapshot and rotation happen together under the journal lock:
+            # a change journaled before it is in the snapshot, one journaled
+            # after it is in the new journal. A status flipped but not yet
+            # journaled can be in both, which is harmless because replay
+            # sets statuses rather than toggling them.
+            data = self.journal.rotate(self._snapshot)
+
+            if background:
+                self._compactor = threading.Thread(target=self._write_snapshot, args=(data,))
+                self._compactor.start()
+            else:
+                self._write_snapshot(data)
+
+    def _snapshot(self):
+        with self._lock:
+            return [b.to_dict() for b in self.books]
+
+    def _write_snapshot(self, data):
+        try:
+            metrics.add("save_bytes", storage.write_records(self.file, data))
+            self.journal.discard_old()
+            log.info("Journal compacted into snapshot.")
+
+        except Exception as e:
+            log.error(f"Error compacting journal: {e}")
+
+    def close(self):
+        with self._save_lock:
+            if self._compactor:
+                self._compactor.join()
+        if self.journal:
+            self.journal.close()
+        if self.loans:
+            self.loans.close()
+        self._close_lazy()
+
+    def overdue_loans(self, now=None):
+        if self.loans is None:
+            return []
+        return self.loans.overdue(now)
+
+    def loans_between(self, start, end):
+        if self.loans is None:
+            return []
+        return self.loans.between(start, end)
+
+    def most_borrowed(self, limit=10):
+        # [(book, times borrowed)], busiest first.
+        if self.loans is None:
+            return []
+        results = []
+        for isbn, count in self.loans.most_borrowed(limit):
+            book = self._get(isbn)
+            if book is not None:
+                results.append((book, count))
+        return results
+
+    @timed("search_title")
     def search_title(self, name):
+        self._ensure_loaded()
+        name = name.lower()
+
+        with self._lock:
+            results = self._title_cache.get(name)
+            if results is not None:
+                self._title_cache.move_to_end(name)
+                self.title_cache_hits += 1
+                metrics.add("title_cache_hits")
+            else:
+                results = [item for item in self._candidates("title", name)
+                           if name in item.title.lower()]
+                self.title_cache_misses += 1
+                metrics.add("title_cache_misses")
+                if self.title_cache_size > 0:
+                    self._title_cache[name] = results
+                    if len(self._title_cache) > self.title_cache_size:
+                        self._title_cache.popitem(last=False)
+
+        log.info(f"Title search performed for: {name}", extra=SEARCH_EVENT)
+        # A copy, so callers can't change what later searches get back.
+        return list(results)
+
+    def title_cache_info(self):
+        with self._lock:
+            return {
+                "hits": self.title_cache_hits,
+                "misses": self.title_cache_misses,
+                "size": len(self._title_cache),
+                "max_size": self.title_cache_size,
+            }
+
+    @timed("search_author")
+    def search_author(self, name):
+        self._ensure_loaded()
         name = name.lower()
         results = []
 
-        for item in self.books:
-            if name in item.title.lower():
-                results.append(item)
+        with self._lock:
+            for item in self._candidates("author", name):
+                if name in item.author.lower():
+                    results.append(item)
+
+        log.info(f"Author search performed for: {name}", extra=SEARCH_EVENT)
+        return results
 
-        logging.info(f"Title search performed for: {name}")
+    @timed("search")
+    def search(self, query, limit=10):
+        self._ensure_loaded()
+        with self._lock:
+            results = [(self.isbn_index[isbn], score)
+                       for isbn, score in self.search_index.search(query, limit)]
+        log.info(f"Ranked search performed for: {query}", extra=SEARCH_EVENT)
         return results
 
+    @timed("search_isbn")
     def search_isbn(self, number):
-        for item in self.books:
-            if item.isbn == number:
-                logging.info(f"ISBN search found: {number}")
-                return item
+        item = self._get(number)
+        if item is not None:
+            log.info(f"ISBN search found: {number}", extra=SEARCH_EVENT)
+            return item
 
-        logging.warning(f"ISBN search failed for: {number}")
+        log.warning(f"ISBN search failed for: {number}", extra=SEARCH_EVENT)
         return None
 
     def show_all(self):
-        output = []
+        # A generator, so the first line prints before the rest is formatted.
+        self._ensure_loaded()
         for i, item in enumerate(self.books, start=1):
-            output.append(f"{i}) {item}")
-        return output
+            yield f"{i}) {item}"
 
+    @timed("page")
+    def page(self, offset=0, limit=20, status=None, author=None, cursor=None):
+        # Returns (books, next_cursor). The cursor is the catalogue position
+        # to resume from, so following it never rescans earlier books.
+        if limit < 1:
+            raise ValueError("Page limit must be at least 1.")
+        if offset < 0 or (cursor is not None and cursor < 0):
+            raise ValueError("Page offset and cursor cannot be negative.")
+        self._ensure_loaded()
+        start = 0 if cursor is None else cursor
 
-    def save_data(self):
-        try:
-            data = [b.to_dict() for b in self.books]
+        if author:
+            name = author.lower()
+            with self._lock:
+                pool = [b for b in self._candidates("author", name)
+                        if name in b.author.lower() and self._positions[b.isbn] >= start]
+        else:
+            if not status:
+                # Nothing to filter, so the offset can be jumped over.
+                start += offset
+                offset = 0
+            pool = (self.books[i] for i in range(start, len(self.books)))
+
+        books = []
+        for book in pool:
+            if status and book.status != status:
+                continue
+            if offset:
+                offset -= 1
+                continue
+            if len(books) == limit:
+                return books, self._positions[book.isbn]
+            books.append(book)
 
-            with open(self.file, "w") as f:
-                json.dump(data, f)
+        return books, None
 
-            logging.info("Data saved successfully.")
+
+    @timed("save_data")
+    def save_data(self):
+        if self.journal is not None:
+            self.compact()
+            return
+
+        try:
+            # Taking the snapshot inside the save lock means a later save
+            # always writes a newer state; the temp file + rename keeps
+            # data.jsonl whole if the process dies mid-write.
+            with self._save_lock:
+                self._ensure_loaded()
+                with self._lock:
+                    data = [b.to_dict() for b in self.books]
+                metrics.add("save_bytes", storage.write_records(self.file, data))
+            log.info("Data saved successfully.")
 
         except Exception as e:
-            logging.error(f"Error saving data: {e}")
+            log.error(f"Error saving data: {e}")
             print("Error saving file:", e)
 
+    @timed("load_data")
     def load_data(self):
+        self._clear_index()
+
+        if (not os.path.exists(self.file) and self.legacy_file
+                and os.path.exists(self.legacy_file)):
+            try:
+                storage.migrate(self.legacy_file, self.file)
+            except json.JSONDecodeError:
+                log.error("Legacy data file corrupted. Not migrated.")
+
         if not os.path.exists(self.file):
-            logging.warning("Data file not found. Starting with empty list.")
-            self.books = []
+            log.warning("Data file not found. Starting with empty list.")
+            if self.journal:
+                self._replay_journal()
             return
 
         try:
-            with open(self.file, "r") as f:
-                data = json.load(f)
+            if self.lazy and storage.detect_format(self.file) == "lines":
+                self._offsets = dict(storage.scan_offsets(self.file))
+                self._lazy_handle = open(self.file, "rb")
+            else:
+                for item in storage.iter_records(self.file):
+                    book_obj = self._load_book(item)
+                    if book_obj is not None and book_obj.isbn not in self.isbn_index:
+                        self._index_book(book_obj)
 
-            for item in data:
-                book_obj = Book(
-                    item["title"],
-                    item["author"],
-                    item["isbn"],
-                    item["status"]
-                )
-                self.books.append(book_obj)
+            log.info("Data loaded successfully.")
 
-            logging.info("Data loaded successfully.")
+            if self.journal:
+                self._replay_journal()
 
         except json.JSONDecodeError:
-            logging.error("Data file corrupted. Fresh list created.")
+            log.error("Data file corrupted. Fresh list created.")
             print("File corrupted. Starting fresh.")
-            self.books = []
+            self._clear_index()
 
         except Exception as e:
-            logging.error(f"Unexpected error loading file: {e}")
+            log.error(f"Unexpected error loading file: {e}")
             print("Error loading file:", e)
-            self.books = []
+            self._clear_index()
+
+    def _replay_journal(self):
+        replayed = 0
+        skipped = 0
+        for entry in self.journal.replay():
+            try:
+                applied = self._apply(entry)
+                reason = "cannot be applied"
+            except (KeyError, TypeError, ValueError, AttributeError) as e:
+                applied, reason = False, e
+            if applied:
+                replayed += 1
+            else:
+                skipped += 1
+                log.warning(f"Skipping bad journal record {entry}: {reason}")
 
+        if replayed:
+            log.info(f"Replayed {replayed} journal records.")
+        if skipped:
+            log.warning(f"Skipped {skipped} bad journal records.")
@@ -0,0 +1,89 @@
+# --------------------------------------------------------------------
+# Name        : Adarsh Rathore
+# Roll No     : <2501410014>
+# Course      : B.Tech CSE (Cyber Security)
+# Semester    : 1st Semester
+# Subject     : Programming for Problem Solving Using Python
+# File        : journal.py
+# Project     : Library Inventory Manager
+# --------------------------------------------------------------------
+
+
+import os
+import json
+import logging
+import threading
+
+log = logging.getLogger(__name__)
+
+
+class Journal:
+    def __init__(self, path):
+        self.path = path
+        self.old_path = path + ".old"
+        self.count = 0
+        self.handle = None
+        self.lock = threading.Lock()
+
+    def open(self):
+        self.count = 0
+        if os.path.exists(self.path):
+            with open(self.path, "r") as f:
+                for line in f:
+                    if line.strip():
+                        self.count += 1
+        self.handle = open(self.path, "a")
+
+    def append(self, *records):
+        data = "".join(json.dumps(r) + "\n" for r in records)
+        with self.lock:
+            self.handle.write(data)
+            self.handle.flush()
+            self.count += len(records)
+
+    def replay(self):
+        # A leftover .old file means a compaction did not finish, so its
+        # records are still newer than the snapshot on disk.
+        for path in (self.old_path, self.path):
+            if not os.path.exists(path):
+                continue
+
+            with open(path, "r") as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        yield json.loads(line)
+                    except json.JSONDecodeError:
+                        # A crash can leave the last record half written.
+                        log.warning(f"Skipping damaged journal record in {path}")
+
+    def rotate(self, snapshot=None):
+        # snapshot() runs with appends held off, so what it captures and the
+        # records moved to .old cover exactly the same changes.
+        with self.lock:
+            data = snapshot() if snapshot else None
+            self.handle.close()
+
+            if os.path.exists(self.old_path):
+                # An earlier compaction failed; keep its records together.
+                with open(self.old_path, "a") as old, open(self.path, "r") as f:
+                    old.write(f.read())
+                os.remove(self.path)
+            else:
+                os.replace(self.path, self.old_path)
+
+            self.handle = open(self.path, "a")
+            self.count = 0
+        return data
+
+    def discard_old(self):
+        if os.path.exists(self.old_path):
+            os.remove(self.old_path)
+
+    def close(self):
+        with self.lock:
+            if self.handle:
+                self.handle.close()
+                self.handle = None
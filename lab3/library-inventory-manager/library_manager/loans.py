@@ -0,0 +1,169 @@
+# --------------------------------------------------------------------
+# Name        : Adarsh Rathore
+# Roll No     : <2501410014>
+# Course      : B.Tech CSE (Cyber Security)
+# Semester    : 1st Semester
+# Subject     : Programming for Problem Solving Using Python
+# File        : loans.py
+# Project     : Library Inventory Manager
+# --------------------------------------------------------------------
+
+
+import os
+import json
+import bisect
+import logging
+import threading
+from collections import Counter
+from datetime import datetime, timedelta
+
+log = logging.getLogger(__name__)
+
+LOAN_DAYS = 14
+
+
+def to_time(text):
+    return datetime.fromisoformat(text) if text else None
+
+
+def from_time(value):
+    return value.isoformat(timespec="seconds") if value else None
+
+
+class Loan:
+    __slots__ = ("isbn", "borrower", "issued", "due", "returned")
+
+    def __init__(self, isbn, borrower, issued, due, returned=None):
+        self.isbn = isbn
+        self.borrower = borrower
+        self.issued = issued
+        self.due = due
+        self.returned = returned
+
+    def is_open(self):
+        return self.returned is None
+
+    def is_overdue(self, now=None):
+        return self.returned is None and self.due < (now or datetime.now())
+
+    def to_dict(self):
+        return {
+            "isbn": self.isbn,
+            "borrower": self.borrower,
+            "issued": from_time(self.issued),
+            "due": from_time(self.due),
+            "returned": from_time(self.returned),
+        }
+
+    def __str__(self):
+        returned = f"returned {self.returned:%Y-%m-%d}" if self.returned else "on loan"
+        return (f"{self.isbn} - {self.borrower or 'unknown'} - issued {self.issued:%Y-%m-%d} "
+                f"- due {self.due:%Y-%m-%d} - {returned}")
+
+
+class LoanHistory:
+    def __init__(self, path="loans.jsonl", loan_days=LOAN_DAYS):
+        self.path = path
+        self.loan_days = loan_days
+        self.handle = None
+        self.lock = threading.Lock()
+
+        # Every loan ever made, in issue-time order, with the issue times
+        # alongside so date ranges are two binary searches.
+        self.loans = []
+        self._issued = []
+        # Open loans by ISBN, plus (due, isbn) for them kept sorted so the
+        # overdue ones are always a prefix.
+        self.open_loans = {}
+        self._due = []
+        self.borrow_counts = Counter()
+
+    def open(self):
+        if os.path.exists(self.path):
+            with open(self.path, "r") as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        self._apply(json.loads(line))
+                    except (json.JSONDecodeError, KeyError, ValueError):
+                        log.warning(f"Skipping damaged loan record in {self.path}")
+        self.handle = open(self.path, "a")
+
+    def _apply(self, record):
+        if record["op"] == "issue":
+            self._add(Loan(record["isbn"], record.get("borrower"),
+                           to_time(record["time"]), to_time(record["due"])))
+        elif record["op"] == "return":
+            self._close(record["isbn"], to_time(record["time"]))
+
+    def _add(self, loan):
+        # A second issue with no return in between means the return was lost.
+        if loan.isbn in self.open_loans:
+            self._close(loan.isbn, loan.issued)
+
+        i = bisect.bisect_right(self._issued, loan.issued)
+        self._issued.insert(i, loan.issued)
+        self.loans.insert(i, loan)
+        self.open_loans[loan.isbn] = loan
+        bisect.insort(self._due, (loan.due, loan.isbn))
+        self.borrow_counts[loan.isbn] += 1
+
+    def _close(self, isbn, when):
+        loan = self.open_loans.pop(isbn, None)
+        if loan is None:
+            return None
+
+        loan.returned = when
+        i = bisect.bisect_left(self._due, (loan.due, isbn))
+        del self._due[i]
+        return loan
+
+    def _write(self, record):
+        self.handle.write(json.dumps(record) + "\n")
+        self.handle.flush()
+
+    def issue(self, isbn, borrower=None, when=None, days=None):
+        when = (when or datetime.now()).replace(microsecond=0)
+        due = when + timedelta(days=self.loan_days if days is None else days)
+        loan = Loan(isbn, borrower or None, when, due)
+
+        with self.lock:
+            self._write({"op": "issue", "isbn": isbn, "borrower": loan.borrower,
+                         "time": from_time(when), "due": from_time(due)})
+            self._add(loan)
+        return loan
+
+    def return_loan(self, isbn, when=None):
+        when = (when or datetime.now()).replace(microsecond=0)
+
+        with self.lock:
+            if isbn not in self.open_loans:
+                # Issued before loan tracking started, so there is nothing to close.
+                return None
+            self._write({"op": "return", "isbn": isbn, "time": from_time(when)})
+            return self._close(isbn, when)
+
+    def overdue(self, now=None):
+        now = now or datetime.now()
+        with self.lock:
+            end = bisect.bisect_left(self._due, (now,))
+            return [self.open_loans[isbn] for _, isbn in self._due[:end]]
+
+    def between(self, start, end):
+        # Loans issued from start up to and including end.
+        with self.lock:
+            lo = bisect.bisect_left(self._issued, start)
+            hi = bisect.bisect_right(self._issued, end)
+            return self.loans[lo:hi]
+
+    def most_borrowed(self, limit=10):
+        with self.lock:
+            return self.borrow_counts.most_common(limit)
+
+    def close(self):
+        with self.lock:
+            if self.handle:
+                self.handle.close()
+                self.handle = None
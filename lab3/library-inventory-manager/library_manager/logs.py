@@ -0,0 +1,124 @@
+# --------------------------------------------------------------------
+# Name        : Adarsh Rathore
+# Roll No     : <2501410014>
+# Course      : B.Tech CSE (Cyber Security)
+# Semester    : 1st Semester
+# Subject     : Programming for Problem Solving Using Python
+# File        : logs.py
+# Project     : Library Inventory Manager
+# --------------------------------------------------------------------
+
+
+import json
+import queue
+import atexit
+import logging
+import itertools
+import threading
+from logging.handlers import QueueHandler
+
+TEXT_FORMAT = "%(asctime)s - %(levelname)s - %(message)s"
+
+# Passed as extra= on the high-frequency search log calls so they can be sampled.
+SEARCH_EVENT = {"event": "search"}
+
+_STOP = object()
+_writer = None
+
+
+class JsonFormatter(logging.Formatter):
+    def format(self, record):
+        entry = {
+            "time": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        if getattr(record, "event", None):
+            entry["event"] = record.event
+        return json.dumps(entry)
+
+
+class SampleFilter(logging.Filter):
+    def __init__(self, rate):
+        super().__init__()
+        self.every = max(1, round(1 / rate)) if rate > 0 else 0
+        self.counter = itertools.count()
+
+    def filter(self, record):
+        if getattr(record, "event", None) != "search":
+            return True
+        # Keep every n-th search record; a counter is cheaper than random().
+        return self.every > 0 and next(self.counter) % self.every == 0
+
+
+class BatchWriter(threading.Thread):
+    def __init__(self, records, filename, formatter, batch_size):
+        super().__init__(name="library-log-writer", daemon=True)
+        self.records = records
+        self.filename = filename
+        self.formatter = formatter
+        self.batch_size = batch_size
+
+    def run(self):
+        with open(self.filename, "a", encoding="utf-8") as f:
+            while True:
+                record = self.records.get()
+                batch = []
+                stop = False
+
+                # Take whatever else is already waiting and write it together.
+                while True:
+                    if record is _STOP:
+                        stop = True
+                        break
+                    batch.append(self.formatter.format(record))
+                    if len(batch) >= self.batch_size:
+                        break
+                    try:
+                        record = self.records.get_nowait()
+                    except queue.Empty:
+                        break
+
+                if batch:
+                    f.write("\n".join(batch) + "\n")
+                    f.flush()
+                if stop:
+                    return
+
+
+def setup_logging(filename="library.log", level=logging.INFO, json_format=False,
+                  search_sample_rate=1.0, batch_size=256):
+    global _writer
+    stop_logging()
+
+    formatter = JsonFormatter() if json_format else logging.Formatter(TEXT_FORMAT)
+    records = queue.SimpleQueue()
+
+    handler = QueueHandler(records)
+    if search_sample_rate < 1.0:
+        handler.addFilter(SampleFilter(search_sample_rate))
+
+    root = logging.getLogger()
+    root.addHandler(handler)
+    root.setLevel(level)
+
+    _writer = BatchWriter(records, filename, formatter, batch_size)
+    _writer.handler = handler
+    _writer.start()
+    return handler
+
+
+def stop_logging():
+    # Flushes everything still queued; safe to call more than once.
+    global _writer
+    if _writer is None:
+        return
+
+    logging.getLogger().removeHandler(_writer.handler)
+    _writer.records.put(_STOP)
+    _writer.join()
+    _writer = None
+
+
+atexit.register(stop_logging)
@@ -0,0 +1,171 @@
+# --------------------------------------------------------------------
+# Name        : Adarsh Rathore
+# Roll No     : <2501410014>
+# Course      : B.Tech CSE (Cyber Security)
+# Semester    : 1st Semester
+# Subject     : Programming for Problem Solving Using Python
+# File        : metrics.py
+# Project     : Library Inventory Manager
+# --------------------------------------------------------------------
+
+
+import io
+import json
+import time
+import bisect
+import pstats
+import cProfile
+import functools
+import threading
+import tracemalloc
+
+# Latency bucket upper bounds in seconds, 1us to 10s.
+BUCKETS = [m * 10 ** e for e in range(-6, 1) for m in (1, 2.5, 5)] + [10.0]
+
+
+class Histogram:
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds):
+        self.counts[bisect.bisect_left(BUCKETS, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def percentile(self, pct):
+        # Upper bound of the bucket holding the pct-th observation.
+        target = self.count * pct / 100
+        seen = 0
+        for i, n in enumerate(self.counts):
+            seen += n
+            if seen >= target and n:
+                return min(BUCKETS[i], self.max) if i < len(BUCKETS) else self.max
+        return 0.0
+
+    def summary(self):
+        return {
+            "count": self.count,
+            "mean_ms": round(self.total / self.count * 1000, 4) if self.count else 0.0,
+            "p50_ms": round(self.percentile(50) * 1000, 4),
+            "p99_ms": round(self.percentile(99) * 1000, 4),
+            "max_ms": round(self.max * 1000, 4),
+        }
+
+
+class Metrics:
+    def __init__(self):
+        self.enabled = False
+        self.lock = threading.Lock()
+        self.counters = {}
+        self.histograms = {}
+        self.gauges = {}
+        self.profiler = None
+
+    def enable(self, on=True):
+        self.enabled = on
+
+    def reset(self):
+        with self.lock:
+            self.counters = {}
+            self.histograms = {}
+
+    def observe(self, name, seconds):
+        with self.lock:
+            self.counters[name] = self.counters.get(name, 0) + 1
+            histogram = self.histograms.get(name)
+            if histogram is None:
+                histogram = self.histograms[name] = Histogram()
+            histogram.observe(seconds)
+
+    def add(self, name, amount=1):
+        if not self.enabled:
+            return
+        with self.lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def set_gauge(self, name, value):
+        # Gauges are one-off readings such as load time, kept even when off.
+        self.gauges[name] = value
+
+    def snapshot(self):
+        with self.lock:
+            return {
+                "gauges": dict(self.gauges),
+                "counters": dict(self.counters),
+                "latency": {name: h.summary() for name, h in self.histograms.items()},
+            }
+
+    def report(self):
+        data = self.snapshot()
+        lines = [f"{'Operation':<16} {'Calls':>8} {'Mean ms':>10} {'p50 ms':>10} {'p99 ms':>10} {'Max ms':>10}"]
+        for name, s in sorted(data["latency"].items()):
+            lines.append(f"{name:<16} {s['count']:>8} {s['mean_ms']:>10.3f} {s['p50_ms']:>10.3f} "
+                         f"{s['p99_ms']:>10.3f} {s['max_ms']:>10.3f}")
+
+        others = {k: v for k, v in data["counters"].items() if k not in data["latency"]}
+        for name, value in sorted(others.items()):
+            lines.append(f"{name:<16} {value:>8}")
+        for name, value in sorted(data["gauges"].items()):
+            lines.append(f"{name:<16} {value:>8.4f}")
+        return "\n".join(lines)
+
+    def dump(self, path):
+        with open(path, "w") as f:
+            json.dump(self.snapshot(), f, indent=2)
+
+    def start_profiling(self):
+        # cProfile only sees the thread that started it.
+        if self.profiler is None:
+            self.profiler = cProfile.Profile()
+            self.profiler.enable()
+
+    def stop_profiling(self, top=25, path=None):
+        if self.profiler is None:
+            return ""
+        self.profiler.disable()
+        if path:
+            self.profiler.dump_stats(path)
+
+        out = io.StringIO()
+        pstats.Stats(self.profiler, stream=out).sort_stats("cumulative").print_stats(top)
+        self.profiler = None
+        return out.getvalue()
+
+    def start_tracemalloc(self):
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    def stop_tracemalloc(self, top=10):
+        if not tracemalloc.is_tracing():
+            return ""
+        current, peak = tracemalloc.get_traced_memory()
+        stats = tracemalloc.take_snapshot().statistics("lineno")[:top]
+        tracemalloc.stop()
+
+        lines = [f"Current: {current / 1024:.1f} KiB, peak: {peak / 1024:.1f} KiB"]
+        lines.extend(str(stat) for stat in stats)
+        return "\n".join(lines)
+
+
+metrics = Metrics()
+
+
+def timed(name):
+    # When metrics are off the only cost is one attribute check.
+    def decorate(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not metrics.enabled:
+                return func(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                metrics.observe(name, time.perf_counter() - start)
+        return wrapper
+    return decorate
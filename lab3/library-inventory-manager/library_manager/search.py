@@ -0,0 +1,176 @@
+# --------------------------------------------------------------------
+# Name        : Adarsh Rathore
+# Roll No     : <2501410014>
+# Course      : B.Tech CSE (Cyber Security)
+# Semester    : 1st Semester
+# Subject     : Programming for Problem Solving Using Python
+# File        : search.py
+# Project     : Library Inventory Manager
+# --------------------------------------------------------------------
+
+
+import re
+import math
+import heapq
+import bisect
+import unicodedata
+
+FIELD_WEIGHTS = {"title": 2.0, "author": 1.0}
+PREFIX_PENALTY = 0.8
+MAX_EXPANSIONS = 50
+
+WORD = re.compile(r"\w+")
+
+
+def fold(text):
+    # Case- and accent-insensitive form: "Émile" and "emile" index the same.
+    text = unicodedata.normalize("NFKD", text)
+    text = "".join(c for c in text if not unicodedata.combining(c))
+    return text.casefold()
+
+
+def tokenize(text):
+    return WORD.findall(fold(text))
+
+
+class SearchIndex:
+    def __init__(self):
+        # field -> token -> {isbn: occurrences}
+        self.postings = {field: {} for field in FIELD_WEIGHTS}
+        self.vocab = []
+        self._words = set()
+        self._new_words = []
+        self.doc_count = 0
+        # field -> token -> highest count in one book, only where above 1
+        self.repeats = {field: {} for field in FIELD_WEIGHTS}
+        # field -> token -> {isbn: count} for the books where count is above
+        # 1. Those are the only ones that score above the rest, so with them
+        # walked first a posting is in best-first order.
+        self.heavy = {field: {} for field in FIELD_WEIGHTS}
+
+    def add(self, book):
+        # Tokenize every field first so a bad value leaves the index untouched.
+        fields = [(field, tokenize(getattr(book, field))) for field in FIELD_WEIGHTS]
+        self.doc_count += 1
+        for field, tokens in fields:
+            index = self.postings[field]
+            for token in tokens:
+                docs = index.get(token)
+                if docs is None:
+                    docs = index[token] = {}
+                    if token not in self._words:
+                        self._words.add(token)
+                        self._new_words.append(token)
+                count = docs[book.isbn] = docs.get(book.isbn, 0) + 1
+                if count > 1:
+                    self.heavy[field].setdefault(token, {})[book.isbn] = count
+                    if count > self.repeats[field].get(token, 1):
+                        self.repeats[field][token] = count
+
+    def _sort_vocab(self):
+        # New words are merged in on the next prefix lookup: a few at a time
+        # by insertion, a bulk load with one sort.
+        if len(self._new_words) <= 64:
+            for token in self._new_words:
+                bisect.insort(self.vocab, token)
+        else:
+            self.vocab.extend(self._new_words)
+            self.vocab.sort()
+        self._new_words = []
+
+    def expand(self, prefix, limit=MAX_EXPANSIONS):
+        if self._new_words:
+            self._sort_vocab()
+
+        # The vocabulary is sorted, so every word starting with the prefix
+        # sits in one contiguous run.
+        start = bisect.bisect_left(self.vocab, prefix)
+        words = []
+        for token in self.vocab[start:start + limit]:
+            if not token.startswith(prefix):
+                break
+            words.append(token)
+        return words
+
+    def _postings(self, term, prefix):
+        # (score per occurrence, best possible score, postings, heavy
+        # postings) for every word/field the term hits.
+        words = self.expand(term) if prefix else [term]
+        found = []
+
+        for word in words:
+            penalty = 1.0 if word == term else PREFIX_PENALTY
+            for field, weight in FIELD_WEIGHTS.items():
+                docs = self.postings[field].get(word)
+                if docs:
+                    unit = weight * math.log(1 + self.doc_count / len(docs)) * penalty
+                    found.append((unit, unit * self.repeats[field].get(word, 1), docs,
+                                  self.heavy[field].get(word)))
+
+        return found
+
+    @staticmethod
+    def _impact_order(docs, heavy):
+        # Books that repeat the word first, best first, then the rest (all
+        # scoring the same) in the order they were added.
+        if not heavy:
+            yield from docs.items()
+            return
+        yield from sorted(heavy.items(), key=lambda item: item[1], reverse=True)
+        for isbn, count in docs.items():
+            if count == 1:
+                yield isbn, count
+
+    @staticmethod
+    def _term_score(found, isbn):
+        # A term scores its best word/field in the book, 0 if it is missing.
+        return max(unit * docs.get(isbn, 0) for unit, _, docs, _ in found)
+
+    def search(self, query, limit=10):
+        terms = tokenize(query)
+        if not terms:
+            return []
+
+        # As-you-type: the last word may be unfinished, so match it as a prefix.
+        typing = not query[-1:].isspace()
+        per_term = [self._postings(t, prefix=(typing and i == len(terms) - 1))
+                    for i, t in enumerate(terms)]
+
+        if not all(per_term):
+            return []
+
+        # Walk the rarest term's postings best-first; every book met there is
+        # scored in full by dictionary lookups in the other terms. The walk
+        # stops once no book further along could beat the current k-th
+        # score, so a common word costs about k books, not all of them.
+        per_term.sort(key=lambda found: sum(len(docs) for _, _, docs, _ in found))
+        first = sorted(per_term[0], key=lambda item: item[1], reverse=True)
+        others_bound = sum(max(bound for _, bound, _, _ in found) for found in per_term[1:])
+
+        top = []  # min-heap of (score, -order, isbn); earlier books win ties
+        seen = set()
+        for unit, bound, docs, heavy in first:
+            if len(top) >= limit and bound + others_bound <= top[0][0]:
+                break
+            for isbn, count in self._impact_order(docs, heavy):
+                if len(top) >= limit and unit * count + others_bound <= top[0][0]:
+                    break
+                if isbn in seen:
+                    continue
+                seen.add(isbn)
+
+                score = 0.0
+                for found in per_term:
+                    best = self._term_score(found, isbn)
+                    if not best:
+                        break
+                    score += best
+                else:
+                    entry = (score, -len(seen), isbn)
+                    if len(top) < limit:
+                        heapq.heappush(top, entry)
+                    elif score > top[0][0]:
+                        heapq.heapreplace(top, entry)
+
+        top.sort(reverse=True)
+        return [(isbn, score) for score, _, isbn in top]
@@ -0,0 +1,377 @@
+# --------------------------------------------------------------------
+# Name        : Adarsh Rathore
+# Roll No     : <2501410014>
+# Course      : B.Tech CSE (Cyber Security)
+# Semester    : 1st Semester
+# Subject     : Programming for Problem Solving Using Python
+# File        : sqlite_inventory.py
+# Project     : Library Inventory Manager
+# --------------------------------------------------------------------
+
+
+from library_manager.book import Book
+from library_manager.loans import Loan, LOAN_DAYS, from_time, to_time
+from library_manager import storage
+from library_manager.logs import SEARCH_EVENT
+from library_manager.metrics import timed
+from library_manager.search import tokenize
+import sqlite3
+import logging
+from datetime import datetime, timedelta
+
+log = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS books (
+    isbn   TEXT PRIMARY KEY,
+    title  TEXT NOT NULL,
+    author TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'available'
+);
+CREATE INDEX IF NOT EXISTS books_title ON books (title COLLATE NOCASE);
+CREATE INDEX IF NOT EXISTS books_status ON books (status);
+
+CREATE TABLE IF NOT EXISTS loans (
+    id       INTEGER PRIMARY KEY,
+    isbn     TEXT NOT NULL,
+    borrower TEXT,
+    issued   TEXT NOT NULL,
+    due      TEXT NOT NULL,
+    returned TEXT
+);
+CREATE INDEX IF NOT EXISTS loans_issued ON loans (issued);
+CREATE INDEX IF NOT EXISTS loans_open_due ON loans (due) WHERE returned IS NULL;
+CREATE INDEX IF NOT EXISTS loans_open_isbn ON loans (isbn) WHERE returned IS NULL;
+
+-- Running totals so "most borrowed" never has to count the loans table.
+CREATE TABLE IF NOT EXISTS loan_counts (
+    isbn  TEXT PRIMARY KEY,
+    count INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS loan_counts_count ON loan_counts (count);
+"""
+
+# Trigram full-text index so substring title searches do not scan the table.
+FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS books_fts USING fts5 (
+    title, author, content='books', content_rowid='rowid', tokenize='trigram'
+);
+CREATE TRIGGER IF NOT EXISTS books_fts_insert AFTER INSERT ON books BEGIN
+    INSERT INTO books_fts (rowid, title, author) VALUES (new.rowid, new.title, new.author);
+END;
+"""
+
+COLUMNS = "b.title, b.author, b.isbn, b.status"
+LOAN_COLUMNS = "isbn, borrower, issued, due, returned"
+
+
+class SqliteInventory:
+    def __init__(self, file="library.db", loan_days=LOAN_DAYS):
+        self.file = file
+        self.loan_days = loan_days
+        self.conn = sqlite3.connect(file)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+
+        try:
+            self.conn.executescript(FTS_SCHEMA)
+            self.fts = True
+        except sqlite3.OperationalError:
+            log.warning("SQLite FTS5 trigram tokenizer unavailable. Using table scans for title search.")
+            self.fts = False
+
+        self.conn.commit()
+        log.info(f"SQLite database opened: {file}")
+
+    @timed("add_book")
+    def add_book(self, book):
+        try:
+            with self.conn:
+                self.conn.execute(
+                    "INSERT INTO books (isbn, title, author, status) VALUES (?, ?, ?, ?)",
+                    (book.isbn, book.title, book.author, book.status)
+                )
+            log.info(f"Book added: {book.title}, {book.author}, {book.isbn}")
+
+        except sqlite3.IntegrityError:
+            log.error("Duplicate ISBN found while adding a book.")
+            print("Error:", "Book with this ISBN already exists.")
+
+        except Exception as e:
+            log.error(f"Error adding book: {e}")
+            print("Error:", e)
+
+    def _track_loan(self, isbn, new, borrower):
+        # Runs inside the status change's transaction, so both commit together.
+        now = datetime.now().replace(microsecond=0)
+        if new == "issued":
+            self.conn.execute(
+                "INSERT INTO loans (isbn, borrower, issued, due) VALUES (?, ?, ?, ?)",
+                (isbn, borrower or None, from_time(now), from_time(now + timedelta(days=self.loan_days)))
+            )
+            self.conn.execute(
+                "INSERT INTO loan_counts (isbn, count) VALUES (?, 1) "
+                "ON CONFLICT (isbn) DO UPDATE SET count = count + 1",
+                (isbn,)
+            )
+        else:
+            self.conn.execute(
+                "UPDATE loans SET returned = ? WHERE isbn = ? AND returned IS NULL",
+                (from_time(now), isbn)
+            )
+
+    def _set_status(self, isbn, old, new, borrower=None):
+        with self.conn:
+            cur = self.conn.execute(
+                "UPDATE books SET status = ? WHERE isbn = ? AND status = ?",
+                (new, isbn, old)
+            )
+            if cur.rowcount:
+                self._track_loan(isbn, new, borrower)
+        if cur.rowcount:
+            return self.search_isbn(isbn)
+
+        if self.search_isbn(isbn) is None:
+            raise KeyError("Book not found.")
+        if new == "issued":
+            raise ValueError("This book is already issued.")
+        raise ValueError("This book is not issued.")
+
+    @timed("issue_book")
+    def issue_book(self, isbn, borrower=None):
+        book = self._set_status(isbn, "available", "issued", borrower)
+        log.info(f"Book issued: {isbn}")
+        return book
+
+    @timed("return_book")
+    def return_book(self, isbn):
+        book = self._set_status(isbn, "issued", "available")
+        log.info(f"Book returned: {isbn}")
+        return book
+
+    def _search(self, column, name):
+        name = name.lower()
+
+        if self.fts and len(name) >= 3 and not any(c in name for c in "%_"):
+            rows = self.conn.execute(
+                f"SELECT {COLUMNS} FROM books_fts f JOIN books b ON b.rowid = f.rowid "
+                f"WHERE f.{column} LIKE ? ORDER BY b.rowid",
+                (f"%{name}%",)
+            )
+        else:
+            rows = self.conn.execute(
+                f"SELECT {COLUMNS} FROM books b WHERE instr(lower(b.{column}), ?) > 0 ORDER BY b.rowid",
+                (name,)
+            )
+
+        # SQLite only folds ASCII case, so confirm the match the Python way.
+        return [Book(*row) for row in rows if name in row[0 if column == "title" else 1].lower()]
+
+    @timed("add_books")
+    def add_books(self, items):
+        report = []
+
+        with self.conn:
+            for item in items:
+                try:
+                    book = item if isinstance(item, Book) else Book(
+                        item["title"], item["author"], item["isbn"], item["status"])
+                except (KeyError, TypeError, ValueError) as e:
+                    isbn = item.get("isbn") if isinstance(item, dict) else None
+                    report.append((isbn, False, f"Invalid record: {e}"))
+                    continue
+
+                cur = self.conn.execute(
+                    "INSERT OR IGNORE INTO books (isbn, title, author, status) VALUES (?, ?, ?, ?)",
+                    (book.isbn, book.title, book.author, book.status)
+                )
+                if cur.rowcount:
+                    report.append((book.isbn, True, "added"))
+                else:
+                    report.append((book.isbn, False, "Book with this ISBN already exists."))
+
+        added = sum(1 for _, ok, _ in report if ok)
+        log.info(f"Bulk add: {added} of {len(report)} books added.")
+        return report
+
+    def _change_many(self, isbns, old, new, done, borrower=None):
+        report = []
+
+        with self.conn:
+            for isbn in isbns:
+                cur = self.conn.execute(
+                    "UPDATE books SET status = ? WHERE isbn = ? AND status = ?",
+                    (new, isbn, old)
+                )
+                if cur.rowcount:
+                    self._track_loan(isbn, new, borrower)
+                    report.append((isbn, True, done))
+                elif self.conn.execute("SELECT 1 FROM books WHERE isbn = ?", (isbn,)).fetchone():
+                    message = "This book is already issued." if new == "issued" else "This book is not issued."
+                    report.append((isbn, False, message))
+                else:
+                    report.append((isbn, False, "Book not found."))
+
+        changed = sum(1 for _, ok, _ in report if ok)
+        log.info(f"Bulk {done}: {changed} of {len(report)} books changed.")
+        return report
+
+    @timed("issue_many")
+    def issue_many(self, isbns, borrower=None):
+        return self._change_many(isbns, "available", "issued", "issued", borrower)
+
+    @timed("return_many")
+    def return_many(self, isbns):
+        return self._change_many(isbns, "issued", "available", "returned")
+
+    @timed("search_title")
+    def search_title(self, name):
+        results = self._search("title", name)
+        log.info(f"Title search performed for: {name.lower()}", extra=SEARCH_EVENT)
+        return results
+
+    @timed("search_author")
+    def search_author(self, name):
+        results = self._search("author", name)
+        log.info(f"Author search performed for: {name.lower()}", extra=SEARCH_EVENT)
+        return results
+
+    @timed("search")
+    def search(self, query, limit=10):
+        # Trigram matching needs at least three characters per word.
+        terms = [t for t in tokenize(query) if len(t) >= 3]
+
+        if self.fts and terms:
+            match = " ".join('"' + t.replace('"', '""') + '"' for t in terms)
+            rows = self.conn.execute(
+                f"SELECT {COLUMNS}, bm25(books_fts, 2.0, 1.0) AS rank "
+                f"FROM books_fts f JOIN books b ON b.rowid = f.rowid "
+                f"WHERE books_fts MATCH ? ORDER BY rank LIMIT ?",
+                (match, limit)
+            )
+            results = [(Book(*row[:4]), -row[4]) for row in rows]
+        else:
+            results = [(book, 1.0) for book in self._search("title", query)[:limit]]
+
+        log.info(f"Ranked search performed for: {query}", extra=SEARCH_EVENT)
+        return results
+
+    @timed("search_isbn")
+    def search_isbn(self, number):
+        row = self.conn.execute(
+            f"SELECT {COLUMNS} FROM books b WHERE b.isbn = ?", (number,)
+        ).fetchone()
+
+        if row:
+            log.info(f"ISBN search found: {number}", extra=SEARCH_EVENT)
+            return Book(*row)
+
+        log.warning(f"ISBN search failed for: {number}", extra=SEARCH_EVENT)
+        return None
+
+    def show_all(self):
+        rows = self.conn.execute(f"SELECT {COLUMNS} FROM books b ORDER BY b.rowid")
+        for i, row in enumerate(rows, start=1):
+            yield f"{i}) {Book(*row)}"
+
+    @timed("page")
+    def page(self, offset=0, limit=20, status=None, author=None, cursor=None):
+        # The cursor is the rowid to continue after, so later pages are
+        # index seeks instead of ever larger OFFSETs.
+        if limit < 1:
+            raise ValueError("Page limit must be at least 1.")
+        if offset < 0 or (cursor is not None and cursor < 0):
+            raise ValueError("Page offset and cursor cannot be negative.")
+        where = ["b.rowid > ?"]
+        params = [0 if cursor is None else cursor]
+        if status:
+            where.append("b.status = ?")
+            params.append(status)
+        if author:
+            where.append("instr(lower(b.author), ?) > 0")
+            params.append(author.lower())
+
+        rows = self.conn.execute(
+            f"SELECT b.rowid, {COLUMNS} FROM books b WHERE {' AND '.join(where)} "
+            f"ORDER BY b.rowid LIMIT ? OFFSET ?",
+            params + [limit + 1, offset]
+        ).fetchall()
+
+        books = [Book(*row[1:]) for row in rows[:limit]]
+        next_cursor = rows[limit - 1][0] if len(rows) > limit else None
+        return books, next_cursor
+
+    @timed("save_data")
+    def save_data(self):
+        # Every change is committed as it happens.
+        self.conn.commit()
+
+    @timed("load_data")
+    def load_data(self):
+        pass
+
+    @timed("import_json")
+    def import_json(self, path, batch_size=10000):
+        # Returns (books imported, records skipped). Every record goes
+        # through Book, as in add_books, so statuses are normalized and a
+        # bad record is skipped instead of aborting the import.
+        imported = 0
+        skipped = 0
+        batch = []
+
+        with self.conn:
+            for item in storage.iter_records(path):
+                try:
+                    book = Book(item["title"], item["author"], item["isbn"], item["status"])
+                    if not all(isinstance(v, str) for v in (book.title, book.author, book.isbn)):
+                        raise TypeError("title, author and isbn must be text")
+                except (KeyError, TypeError, ValueError, AttributeError) as e:
+                    isbn = item.get("isbn") if isinstance(item, dict) else item
+                    log.warning(f"Skipping bad book record {isbn!r}: {e}")
+                    skipped += 1
+                    continue
+                batch.append((book.isbn, book.title, book.author, book.status))
+                if len(batch) >= batch_size:
+                    imported += self._insert_batch(batch)
+                    batch = []
+            imported += self._insert_batch(batch)
+
+        log.info(f"Imported {imported} books from {path}, skipped {skipped} bad records.")
+        return imported, skipped
+
+    def _insert_batch(self, batch):
+        cur = self.conn.executemany(
+            "INSERT OR IGNORE INTO books (isbn, title, author, status) VALUES (?, ?, ?, ?)",
+            batch
+        )
+        return cur.rowcount
+
+    @staticmethod
+    def _make_loan(row):
+        return Loan(row[0], row[1], to_time(row[2]), to_time(row[3]), to_time(row[4]))
+
+    def overdue_loans(self, now=None):
+        rows = self.conn.execute(
+            f"SELECT {LOAN_COLUMNS} FROM loans WHERE returned IS NULL AND due < ? ORDER BY due",
+            (from_time(now or datetime.now()),)
+        )
+        return [self._make_loan(row) for row in rows]
+
+    def loans_between(self, start, end):
+        rows = self.conn.execute(
+            f"SELECT {LOAN_COLUMNS} FROM loans WHERE issued BETWEEN ? AND ? ORDER BY issued",
+            (from_time(start), from_time(end))
+        )
+        return [self._make_loan(row) for row in rows]
+
+    def most_borrowed(self, limit=10):
+        rows = self.conn.execute(
+            f"SELECT {COLUMNS}, c.count FROM loan_counts c JOIN books b ON b.isbn = c.isbn "
+            f"ORDER BY c.count DESC LIMIT ?",
+            (limit,)
+        )
+        return [(Book(*row[:4]), row[4]) for row in rows]
+
+    def close(self):
+        self.conn.close()
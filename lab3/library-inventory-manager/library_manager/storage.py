@@ -0,0 +1,150 @@
+# --------------------------------------------------------------------
+# Name        : Adarsh Rathore
+# Roll No     : <2501410014>
+# Course      : B.Tech CSE (Cyber Security)
+# Semester    : 1st Semester
+# Subject     : Programming for Problem Solving Using Python
+# File        : storage.py
+# Project     : Library Inventory Manager
+# --------------------------------------------------------------------
+
+
+import os
+import re
+import csv
+import json
+import logging
+
+log = logging.getLogger(__name__)
+
+CHUNK_SIZE = 64 * 1024
+ISBN_PATTERN = re.compile(rb'"isbn":\s*("(?:[^"\\]|\\.)*")')
+
+_decoder = json.JSONDecoder()
+
+
+def detect_format(path):
+    # The old data.json is one JSON array; the new format is one book per line.
+    with open(path, "r") as f:
+        while True:
+            ch = f.read(1)
+            if not ch:
+                return "lines"
+            if not ch.isspace():
+                return "array" if ch == "[" else "lines"
+
+
+def iter_records(path):
+    if detect_format(path) == "array":
+        yield from _iter_array(path)
+        return
+
+    with open(path, "r") as f:
+        for number, line in enumerate(f, start=1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                log.error(f"Skipping corrupted record on line {number} of {path}")
+
+
+def _iter_array(path):
+    # Decode one object at a time from the array so the whole list never
+    # has to exist in memory.
+    with open(path, "r") as f:
+        buffer = ""
+        pos = 0
+        started = False
+        eof = False
+
+        while True:
+            while pos < len(buffer) and (buffer[pos].isspace() or buffer[pos] == ","):
+                pos += 1
+
+            if not started and pos < len(buffer):
+                if buffer[pos] != "[":
+                    raise json.JSONDecodeError("Expected '['", buffer, pos)
+                started = True
+                pos += 1
+                continue
+
+            if pos < len(buffer) and buffer[pos] == "]":
+                return
+
+            if pos < len(buffer):
+                try:
+                    item, end = _decoder.raw_decode(buffer, pos)
+                    yield item
+                    pos = end
+                    continue
+                except json.JSONDecodeError:
+                    if eof:
+                        raise
+
+            if eof:
+                if not started:
+                    return
+                raise json.JSONDecodeError("Unterminated array", buffer, pos)
+
+            chunk = f.read(CHUNK_SIZE)
+            if not chunk:
+                eof = True
+            buffer = buffer[pos:] + chunk
+            pos = 0
+
+
+def iter_book_file(path):
+    # Supplier feeds come as CSV with a header row or as JSON Lines; a
+    # record without a status is a new, available book in either.
+    if not path.lower().endswith(".csv"):
+        for item in iter_records(path):
+            if isinstance(item, dict) and not item.get("status"):
+                item["status"] = "available"
+            yield item
+        return
+
+    with open(path, "r", encoding="utf-8-sig", newline="") as f:
+        reader = csv.DictReader(f)
+        for row in reader:
+            if not any(row.values()):
+                continue
+            item = {k.strip().lower(): (v or "").strip() for k, v in row.items() if k}
+            if not item.get("status"):
+                item["status"] = "available"
+            yield item
+
+
+def write_records(path, records):
+    # Returns the number of bytes written; json.dumps output is plain ASCII.
+    tmp = path + ".tmp"
+    written = 0
+    with open(tmp, "w") as f:
+        for record in records:
+            line = json.dumps(record) + "\n"
+            f.write(line)
+            written += len(line)
+    os.replace(tmp, path)
+    return written
+
+
+def migrate(source, target):
+    write_records(target, iter_records(source))
+    log.info(f"Migrated {source} to JSON Lines file {target}.")
+
+
+def scan_offsets(path):
+    # Only pulls the ISBN out of each line, so lazy loading skips json parsing.
+    offset = 0
+    with open(path, "rb") as f:
+        for line in f:
+            match = ISBN_PATTERN.search(line)
+            if match:
+                yield json.loads(match.group(1)), offset
+            offset += len(line)
+
+
+def read_record_at(handle, offset):
+    handle.seek(offset)
+    return json.loads(handle.readline())